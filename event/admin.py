@@ -9,12 +9,15 @@ from event.models import (
     City,
     ZipCode,
     AppVersion,
+    CrawlRun,
+    CrawlWorkItem,
+    CrawlStat,
 )
 
 
 class EventAdmin(admin.ModelAdmin):
-    search_fields = ['title', 'description']
-    list_display = ['title', 'city__city_name', 'start_date', ]
+    search_fields = ['title', 'description', 'external_id']
+    list_display = ['title', 'city__city_name', 'start_date', 'event_source', ]
     list_filter = ['event_source']
     # list_filter = ['start_date', 'valid', 'city']
 
@@ -31,6 +34,31 @@ class AppVersionAdmin(admin.ModelAdmin):
                        'commit_hash', 'commit_branch']
 
 
+class CrawlRunAdmin(admin.ModelAdmin):
+    list_display = ['engine', 'shard', 'status', 'started_at', 'wall_seconds',
+                    'items_completed', 'items_failed', 'items_skipped',
+                    'http_requests', 'db_queries', 'events_created', 'events_updated',
+                    'images_downloaded', 'error_count']
+    list_filter = ['engine', 'status']
+    readonly_fields = ['owner', 'started_at', 'finished_at', 'errors']
+
+
+class CrawlWorkItemAdmin(admin.ModelAdmin):
+    list_display = ['key', 'status', 'attempts', 'last_completed_at', 'next_due_at',
+                    'lease_owner', 'leased_until']
+    list_filter = ['engine', 'status']
+    search_fields = ['key', 'city__city_ascii', 'search_phrase__query']
+    raw_id_fields = ['search_phrase', 'city', 'run']
+
+
+class CrawlStatAdmin(admin.ModelAdmin):
+    list_display = ['work_item', 'created', 'updated', 'skipped', 'empty', 'failed',
+                    'wall_seconds', 'http_requests', 'db_queries', 'images_downloaded',
+                    'recorded_at']
+    list_filter = ['work_item__engine', 'empty', 'failed']
+    raw_id_fields = ['work_item', 'run']
+
+
 admin.site.register(Country)
 admin.site.register(Location)
 admin.site.register(SearchPhrase)
@@ -40,3 +68,6 @@ admin.site.register(BetaSubscriber)
 admin.site.register(City, CityAdmin)
 admin.site.register(ZipCode)
 admin.site.register(AppVersion, AppVersionAdmin)
+admin.site.register(CrawlRun, CrawlRunAdmin)
+admin.site.register(CrawlWorkItem, CrawlWorkItemAdmin)
+admin.site.register(CrawlStat, CrawlStatAdmin)
@@ -0,0 +1,198 @@
+import json
+import base64
+import binascii
+from datetime import date, datetime
+from urllib.parse import urlencode
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from event.utils.pagination import CountingPaginator
+
+CURSOR_QUERY_PARAM = "cursor"
+
+
+def encode_cursor(values):
+    position = [value.isoformat() if isinstance(value, (date, datetime)) else value
+                for value in values]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError):
+        raise NotFound("Invalid cursor")
+    if not isinstance(position, list):
+        raise NotFound("Invalid cursor")
+    return position
+
+
+def uses_keyset(request):
+    """Clients opt into cursors with `?cursor=` (empty for the first page)."""
+    return CURSOR_QUERY_PARAM in request.query_params
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only keyset pagination for infinite scroll.
+
+    Rows are ordered by `ordering`, which must end in a unique field, and
+    the next page starts strictly after the last row sent, so no page
+    needs an OFFSET or a COUNT(*). The cursor is the opaque encoding of
+    that row's ordering values.
+    """
+    ordering = ("start_date", "id")
+    page_size = 24
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = CURSOR_QUERY_PARAM
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self):
+        return [(field.lstrip("-"), field.startswith("-")) for field in self.ordering]
+
+    def get_position_field(self, queryset, name):
+        """The model field, or the annotation's output field, behind `name`."""
+        try:
+            return queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return queryset.query.annotations[name].output_field
+
+    def parse_position(self, queryset, position):
+        """Convert a decoded cursor's values to their fields' types, rejecting any that do not fit."""
+        ordering = self.get_ordering()
+        if len(position) != len(ordering):
+            raise NotFound("Invalid cursor")
+        values = []
+        for (field, _), value in zip(ordering, position):
+            if value is None:
+                raise NotFound("Invalid cursor")
+            try:
+                values.append(self.get_position_field(queryset, field).to_python(value))
+            except (ValidationError, ValueError, TypeError):
+                raise NotFound("Invalid cursor")
+        return values
+
+    def after(self, position):
+        """Rows strictly after `position` in the ordering, as a Q tree."""
+        ordering = self.get_ordering()
+        if len(position) != len(ordering):
+            raise NotFound("Invalid cursor")
+        condition = Q()
+        for index in reversed(range(len(ordering))):
+            field, descending = ordering[index]
+            step = Q(**{f"{field}__{'lt' if descending else 'gt'}": position[index]})
+            if index < len(ordering) - 1:
+                step |= Q(**{field: position[index]}) & condition
+            condition = step
+        return condition
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(
+                self.after(self.parse_position(queryset, decode_cursor(cursor))))
+
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_position = [
+            getattr(rows[-1], field) for field, _ in self.get_ordering()] if rows else None
+        return rows
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                    "example": "http://api.example.org/events/?{}".format(
+                        urlencode({self.cursor_query_param: "WyIyMDI1LTAxLTAxIiwgNDJd"})),
+                },
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Cursor from the previous page's `next` link; pass it empty for the first page.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class CountingPageNumberPagination(PageNumberPagination):
+    """
+    Page-number pagination whose `count` is cached, and a planner estimate
+    for large results; `count_is_approximate` tells clients which.
+    """
+    django_paginator_class = CountingPaginator
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data["count_is_approximate"] = self.page.paginator.approximate
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_approximate"] = {
+            "type": "boolean",
+            "example": False,
+        }
+        return response_schema
+
+
+class KeysetOrPageNumberMixin:
+    """
+    List views keep their page-number `pagination_class` and switch to
+    `keyset_pagination_class` when the client sends a `cursor` parameter.
+    """
+    keyset_pagination_class = KeysetPagination
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator") and uses_keyset(self.request):
+            self._paginator = self.keyset_pagination_class()
+        return super().paginator
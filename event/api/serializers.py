@@ -41,18 +41,26 @@ class CitySerializer(serializers.ModelSerializer):
 class EventSerializer(serializers.ModelSerializer):
     """Serializer for Event model with nested city information."""
     city = CitySerializer(read_only=True)
+    event_image_variants = serializers.SerializerMethodField(
+        help_text="Resized WebP/JPEG copies of the event image with srcset strings")
 
     @extend_schema_field(OpenApiTypes.URI)
     def get_event_image(self, obj):
         """Get event image URL or default placeholder."""
         return obj.get_event_image
 
+    @extend_schema_field(OpenApiTypes.OBJECT)
+    def get_event_image_variants(self, obj):
+        """Get responsive image variants (thumbnail, card, hero) of the event image."""
+        return obj.get_event_image_variants
+
     class Meta:
         model = Event
         fields = [
             "id",
             "title",
             "event_image",
+            "event_image_variants",
             "start_date",
             "end_date",
             "description",
@@ -1,5 +1,5 @@
 
-from rest_framework.pagination import PageNumberPagination
+from event.api.pagination import KeysetPagination, KeysetOrPageNumberMixin, CountingPageNumberPagination
 from django.utils import timezone
 from rest_framework.generics import ListAPIView
 from rest_framework.response import Response
@@ -10,17 +10,24 @@ from event.api.serializers import EventSerializer
 from event.api.authentication import BearerTokenAuthentication
 
 
-class CustomPagination(PageNumberPagination):
+class CustomPagination(CountingPageNumberPagination):
     page_size = 10  # Set number of events per page
     page_size_query_param = 'page_size'
     max_page_size = 50
 
 
-class ActiveEventListView(ListAPIView):
+class CustomKeysetPagination(KeysetPagination):
+    page_size = 10
+    max_page_size = 50
+
+
+class ActiveEventListView(KeysetOrPageNumberMixin, ListAPIView):
     serializer_class = EventSerializer
     authentication_classes = [BearerTokenAuthentication]
     permission_classes = [IsAuthenticated]
     pagination_class = CustomPagination
+    # `?cursor=` switches to keyset pages: no count, constant cost per page
+    keyset_pagination_class = CustomKeysetPagination
 
     def get_queryset(self):
         return Event.objects.filter(start_date__gt=timezone.now().date())
@@ -1,3 +1,4 @@
+import os
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 
@@ -6,12 +7,116 @@ SERP_API_KEY = getattr(settings, 'SERP_API_KEY', None)
 EVENT_ENGINES = getattr(settings, 'EVENT_ENGINES', None)
 EVENTBRITE_API_KEY = getattr(settings, 'EVENTBRITE_API_KEY', None)
 EVENTBRITE_API_ENDPOINT = getattr(settings, 'EVENTBRITE_API_ENDPOINT', None)
+# Event details fetched in parallel per search page. They still share the
+# API host's rate budget (CRAWL_RATE_LIMITS) and CRAWL_PER_HOST_CONCURRENCY.
+EVENTBRITE_DETAIL_WORKERS = getattr(settings, 'EVENTBRITE_DETAIL_WORKERS', 4)
 
 SERP_API_ENDPOINT = getattr(
     settings, 'SERP_API_ENDPOINT', SERP_API_ENDPOINT)
 
 TICKET_MASTER_API_KEY = getattr(
     settings, 'TICKET_MASTER_API_KEY', None)
+TICKET_MASTER_API_ENDPOINT = getattr(
+    settings, 'TICKET_MASTER_API_ENDPOINT', "https://app.ticketmaster.com/discovery/v2/events.json")
+# Events are searched within this radius of a city's coordinates; cities
+# without coordinates are searched by state code. The API pages at most
+# 1000 events deep (page size * page number).
+TICKET_MASTER_RADIUS_MILES = getattr(settings, 'TICKET_MASTER_RADIUS_MILES', 25)
+TICKET_MASTER_PAGE_SIZE = getattr(settings, 'TICKET_MASTER_PAGE_SIZE', 200)
+
+# Crawling
+CRAWL_CONCURRENCY = getattr(settings, 'CRAWL_CONCURRENCY', 1)
+CRAWL_PER_HOST_CONCURRENCY = getattr(
+    settings, 'CRAWL_PER_HOST_CONCURRENCY', 2)
+# Politeness budget per host: `rate` is requests per second, `burst` is
+# how many requests may go out back to back. Hosts not listed here are
+# unthrottled until they answer with a 429.
+CRAWL_RATE_LIMITS = getattr(settings, 'CRAWL_RATE_LIMITS', {
+    "www.eventbrite.com": {"rate": 1 / 30, "burst": 2},
+    "www.eventbriteapi.com": {"rate": 1 / 5, "burst": 4},
+    "allevents.in": {"rate": 1 / 5, "burst": 2},
+    "www.artidea.org": {"rate": 1 / 3, "burst": 2},
+    "app.ticketmaster.com": {"rate": 4, "burst": 5},
+})
+CRAWL_MAX_RETRIES = getattr(settings, 'CRAWL_MAX_RETRIES', 3)
+# On-disk response cache for scraper fetches. Entries without ETag or
+# Last-Modified are reused for CRAWL_CACHE_TTL seconds.
+CRAWL_CACHE_ENABLED = getattr(settings, 'CRAWL_CACHE_ENABLED', True)
+CRAWL_CACHE_DIR = getattr(
+    settings, 'CRAWL_CACHE_DIR', os.path.join(settings.BASE_DIR, 'cache', 'crawl'))
+CRAWL_CACHE_TTL = getattr(settings, 'CRAWL_CACHE_TTL', 60 * 60 * 12)
+CRAWL_IMAGE_WORKERS = getattr(settings, 'CRAWL_IMAGE_WORKERS', 4)
+# Raw response archive (gzip JSON lines, one file per crawl process) that
+# `reparse_archive` replays through the current parsers.
+CRAWL_ARCHIVE_ENABLED = getattr(settings, 'CRAWL_ARCHIVE_ENABLED', False)
+CRAWL_ARCHIVE_DIR = getattr(
+    settings, 'CRAWL_ARCHIVE_DIR', os.path.join(settings.BASE_DIR, 'archive', 'crawl'))
+# Crawl pipeline: fetch (CRAWL_CONCURRENCY threads) -> parse -> persist,
+# with at most CRAWL_PIPELINE_QUEUE_SIZE pages waiting between stages.
+CRAWL_PARSE_WORKERS = getattr(settings, 'CRAWL_PARSE_WORKERS', 1)
+CRAWL_PERSIST_WORKERS = getattr(settings, 'CRAWL_PERSIST_WORKERS', 1)
+CRAWL_PIPELINE_QUEUE_SIZE = getattr(settings, 'CRAWL_PIPELINE_QUEUE_SIZE', 8)
+# Checkpoints: `fetch_events --resume` skips work items completed within
+# this many hours. A work item lease expires after CRAWL_LEASE_SECONDS so
+# items held by a crashed run are picked up again.
+CRAWL_RESUME_WINDOW_HOURS = getattr(settings, 'CRAWL_RESUME_WINDOW_HOURS', 24)
+CRAWL_LEASE_SECONDS = getattr(settings, 'CRAWL_LEASE_SECONDS', 60 * 30)
+# Crawl planner: phrases merged into one SerpAPI query per city, and the
+# look-back used to rank cities by how many events they recently yielded.
+CRAWL_PLAN_SERP_PHRASES_PER_QUERY = getattr(
+    settings, 'CRAWL_PLAN_SERP_PHRASES_PER_QUERY', 3)
+CRAWL_PLAN_YIELD_DAYS = getattr(settings, 'CRAWL_PLAN_YIELD_DAYS', 30)
+# Adaptive scheduling (`fetch_events --adaptive`): base recrawl interval
+# per source, how far it may shrink for busy cities or grow for dead ones,
+# and how many new events per crawl count as high churn.
+CRAWL_ADAPTIVE_INTERVAL_HOURS = getattr(settings, 'CRAWL_ADAPTIVE_INTERVAL_HOURS', {
+    "serp_api_google_event": 24 * 14,
+    "eventbrite": 48,
+    "all_events_in": 48,
+    "artidea": 24 * 7,
+    "ticketmaster": 48,
+})
+CRAWL_ADAPTIVE_MAX_SPEEDUP = getattr(settings, 'CRAWL_ADAPTIVE_MAX_SPEEDUP', 4)
+CRAWL_ADAPTIVE_MAX_BACKOFF = getattr(settings, 'CRAWL_ADAPTIVE_MAX_BACKOFF', 8)
+CRAWL_ADAPTIVE_CHURN_EVENTS = getattr(settings, 'CRAWL_ADAPTIVE_CHURN_EVENTS', 10)
+CRAWL_ADAPTIVE_HISTORY = getattr(settings, 'CRAWL_ADAPTIVE_HISTORY', 5)
+# How embedded JSON is pulled out of listing pages, per source: "fast"
+# decodes it in place and falls back to "soup", the full BeautifulSoup parse.
+CRAWL_EXTRACTION_MODES = getattr(settings, 'CRAWL_EXTRACTION_MODES', {
+    "eventbrite": "fast",
+    "all_events_in": "fast",
+})
+# Crawl history shown on the monitor page, and the share of the engine's
+# average yield below which a run is flagged as a drop.
+CRAWL_MONITOR_RUNS = getattr(settings, 'CRAWL_MONITOR_RUNS', 10)
+CRAWL_MONITOR_YIELD_DROP = getattr(settings, 'CRAWL_MONITOR_YIELD_DROP', 0.5)
+# Listing pages walked per (city, phrase), per source, and how many of
+# them are fetched at once. The walk stops at the first page holding only
+# known events.
+CRAWL_MAX_PAGES = getattr(settings, 'CRAWL_MAX_PAGES', {
+    "eventbrite": 3,
+    "all_events_in": 3,
+    "ticketmaster": 5,
+})
+CRAWL_PAGE_WORKERS = getattr(settings, 'CRAWL_PAGE_WORKERS', 2)
+
+# Responsive derivatives generated for every event image (label: width px)
+EVENT_IMAGE_VARIANTS = getattr(settings, 'EVENT_IMAGE_VARIANTS', {
+    "thumbnail": 160,
+    "card": 480,
+    "hero": 1200,
+})
+EVENT_IMAGE_QUALITY = getattr(settings, 'EVENT_IMAGE_QUALITY', 80)
+
+# Paginated totals: results the planner estimates at this many rows or
+# more report the estimate instead of a COUNT(*). Totals are cached for
+# PAGINATION_COUNT_CACHE_TTL seconds.
+PAGINATION_ESTIMATE_THRESHOLD = getattr(settings, 'PAGINATION_ESTIMATE_THRESHOLD', 5000)
+PAGINATION_COUNT_CACHE_TTL = getattr(settings, 'PAGINATION_COUNT_CACHE_TTL', 60)
+# Search result cache: ranked event IDs per normalized query, dropped when
+# events change. Results larger than SEARCH_RESULT_CACHE_MAX_IDS are not cached.
+SEARCH_RESULT_CACHE_TTL = getattr(settings, 'SEARCH_RESULT_CACHE_TTL', 60 * 10)
+SEARCH_RESULT_CACHE_MAX_IDS = getattr(settings, 'SEARCH_RESULT_CACHE_MAX_IDS', 5000)
 
 
 class AppSettings:
@@ -20,8 +125,45 @@ class AppSettings:
             "SERP_API_KEY": SERP_API_KEY,
             "SERP_API_ENDPOINT": SERP_API_ENDPOINT,
             "TICKET_MASTER_API_KEY": TICKET_MASTER_API_KEY,
+            "TICKET_MASTER_API_ENDPOINT": TICKET_MASTER_API_ENDPOINT,
+            "TICKET_MASTER_RADIUS_MILES": TICKET_MASTER_RADIUS_MILES,
+            "TICKET_MASTER_PAGE_SIZE": TICKET_MASTER_PAGE_SIZE,
             "EVENTBRITE_API_KEY": EVENTBRITE_API_KEY,
             "EVENTBRITE_API_ENDPOINT": EVENTBRITE_API_ENDPOINT,
+            "EVENTBRITE_DETAIL_WORKERS": EVENTBRITE_DETAIL_WORKERS,
+            "CRAWL_CONCURRENCY": CRAWL_CONCURRENCY,
+            "CRAWL_PER_HOST_CONCURRENCY": CRAWL_PER_HOST_CONCURRENCY,
+            "CRAWL_RATE_LIMITS": CRAWL_RATE_LIMITS,
+            "CRAWL_MAX_RETRIES": CRAWL_MAX_RETRIES,
+            "CRAWL_CACHE_ENABLED": CRAWL_CACHE_ENABLED,
+            "CRAWL_CACHE_DIR": CRAWL_CACHE_DIR,
+            "CRAWL_CACHE_TTL": CRAWL_CACHE_TTL,
+            "CRAWL_IMAGE_WORKERS": CRAWL_IMAGE_WORKERS,
+            "CRAWL_ARCHIVE_ENABLED": CRAWL_ARCHIVE_ENABLED,
+            "CRAWL_ARCHIVE_DIR": CRAWL_ARCHIVE_DIR,
+            "CRAWL_PARSE_WORKERS": CRAWL_PARSE_WORKERS,
+            "CRAWL_PERSIST_WORKERS": CRAWL_PERSIST_WORKERS,
+            "CRAWL_PIPELINE_QUEUE_SIZE": CRAWL_PIPELINE_QUEUE_SIZE,
+            "CRAWL_RESUME_WINDOW_HOURS": CRAWL_RESUME_WINDOW_HOURS,
+            "CRAWL_LEASE_SECONDS": CRAWL_LEASE_SECONDS,
+            "CRAWL_PLAN_SERP_PHRASES_PER_QUERY": CRAWL_PLAN_SERP_PHRASES_PER_QUERY,
+            "CRAWL_PLAN_YIELD_DAYS": CRAWL_PLAN_YIELD_DAYS,
+            "CRAWL_ADAPTIVE_INTERVAL_HOURS": CRAWL_ADAPTIVE_INTERVAL_HOURS,
+            "CRAWL_ADAPTIVE_MAX_SPEEDUP": CRAWL_ADAPTIVE_MAX_SPEEDUP,
+            "CRAWL_ADAPTIVE_MAX_BACKOFF": CRAWL_ADAPTIVE_MAX_BACKOFF,
+            "CRAWL_ADAPTIVE_CHURN_EVENTS": CRAWL_ADAPTIVE_CHURN_EVENTS,
+            "CRAWL_ADAPTIVE_HISTORY": CRAWL_ADAPTIVE_HISTORY,
+            "CRAWL_EXTRACTION_MODES": CRAWL_EXTRACTION_MODES,
+            "CRAWL_MAX_PAGES": CRAWL_MAX_PAGES,
+            "CRAWL_PAGE_WORKERS": CRAWL_PAGE_WORKERS,
+            "CRAWL_MONITOR_RUNS": CRAWL_MONITOR_RUNS,
+            "CRAWL_MONITOR_YIELD_DROP": CRAWL_MONITOR_YIELD_DROP,
+            "EVENT_IMAGE_VARIANTS": EVENT_IMAGE_VARIANTS,
+            "EVENT_IMAGE_QUALITY": EVENT_IMAGE_QUALITY,
+            "PAGINATION_ESTIMATE_THRESHOLD": PAGINATION_ESTIMATE_THRESHOLD,
+            "PAGINATION_COUNT_CACHE_TTL": PAGINATION_COUNT_CACHE_TTL,
+            "SEARCH_RESULT_CACHE_TTL": SEARCH_RESULT_CACHE_TTL,
+            "SEARCH_RESULT_CACHE_MAX_IDS": SEARCH_RESULT_CACHE_MAX_IDS,
         }
 
     def __getattr__(self, item):
@@ -0,0 +1,115 @@
+import os
+import gzip
+import json
+import uuid
+import socket
+import logging
+import threading
+from datetime import datetime, timezone
+from urllib.parse import urlparse, urlencode, parse_qsl, urlunparse
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIX = ".jsonl.gz"
+# Query parameters never written to the archive
+SECRET_PARAMS = {"api_key", "apikey", "token", "key"}
+ARCHIVED_CONTENT_TYPES = ("json", "html", "text")
+
+
+def strip_secrets(url):
+    parsed = urlparse(url)
+    query = [(name, value) for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+             if name.lower() not in SECRET_PARAMS]
+    return urlunparse(parsed._replace(query=urlencode(query)))
+
+
+class ResponseArchive:
+    """
+    Append-only archive of the raw responses an engine parsed.
+
+    Every process writes its own gzip file under `<directory>/<engine>/`,
+    one JSON record per line with the URL (API keys stripped), the fetch
+    time, the engine and the body. The stream is flushed after every
+    record, so a crawl that dies keeps everything it archived up to then.
+    Replay the archive with `manage.py reparse_archive`.
+    """
+
+    def __init__(self, directory, engine):
+        self.directory = os.path.join(directory, engine)
+        self.engine = engine
+        self._lock = threading.Lock()
+        self._file = None
+        self.path = None
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H%M%S")
+        name = f"{stamp}-{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}{ARCHIVE_SUFFIX}"
+        self.path = os.path.join(self.directory, name)
+        self._file = gzip.open(self.path, "ab")
+
+    def should_archive(self, response):
+        content_type = response.headers.get("Content-Type", "")
+        return response.status_code == 200 and bool(response.url) and any(
+            kind in content_type for kind in ARCHIVED_CONTENT_TYPES)
+
+    def write(self, response):
+        if not self.should_archive(response):
+            return
+        record = json.dumps({
+            "url": strip_secrets(response.url),
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "engine": self.engine,
+            "body": response.text,
+        })
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._file.write(record.encode() + b"\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                logger.info(f"Archived responses to {self.path}")
+
+
+def archive_files(directory, engines=None, since=None):
+    """Archive files under `directory`, oldest first, for `engines` and fetched on or after `since`."""
+    if not os.path.isdir(directory):
+        return []
+    files = []
+    for engine in sorted(os.listdir(directory)):
+        folder = os.path.join(directory, engine)
+        if not os.path.isdir(folder) or (engines and engine not in engines):
+            continue
+        for name in os.listdir(folder):
+            path = os.path.join(folder, name)
+            if not name.endswith(ARCHIVE_SUFFIX):
+                continue
+            # A file last written before `since` holds nothing newer
+            if since is not None and datetime.fromtimestamp(
+                    os.path.getmtime(path), timezone.utc).date() < since:
+                continue
+            # Names start with the UTC time the file was opened
+            files.append((name, path))
+    return [path for _, path in sorted(files)]
+
+
+def read_archive(paths, since=None):
+    """Yield the records of archive files. A file cut short by a crash is read up to where it stops."""
+    for path in paths:
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as archive:
+                for line in archive:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        logger.warning(f"Skipping a truncated record in {path}")
+                        continue
+                    if since is None or record["fetched_at"][:10] >= since.isoformat():
+                        yield record
+        except (EOFError, OSError) as e:
+            logger.warning(f"Archive {path} ends early: {e}")
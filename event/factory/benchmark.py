@@ -0,0 +1,229 @@
+import os
+import json
+import time
+import logging
+import tracemalloc
+from collections import defaultdict
+from urllib.parse import urlparse
+
+from django.core.exceptions import ImproperlyConfigured
+
+from event.models import City
+from event.factory.checkpoint import CrawlCheckpoint
+from event.factory.engine import (
+    EventbriteWebScraperPlusAPI, AlleventsInScraper, ArtIdeaScraper)
+from event.factory.http import CrawlSession
+from event.factory.scrapers.luma_scaper import LumaEventScraper
+
+logger = logging.getLogger(__name__)
+
+# Corpus folders, one per kind of recorded page
+PAGE_KINDS = ("eventbrite", "eventbrite_api", "all_events", "artidea", "luma")
+PAGE_EXTENSIONS = (".html", ".json")
+# Engine whose parsers handle each kind; Luma pages use LumaEventScraper
+KIND_ENGINES = {
+    "eventbrite": EventbriteWebScraperPlusAPI,
+    "eventbrite_api": EventbriteWebScraperPlusAPI,
+    "all_events": AlleventsInScraper,
+    "artidea": ArtIdeaScraper,
+}
+
+
+def classify_url(url):
+    """Map a recorded URL to the corpus folder its page belongs to."""
+    parsed = urlparse(url or "")
+    host = parsed.netloc.lower()
+    if host.endswith("eventbriteapi.com"):
+        return "eventbrite_api"
+    if host.endswith("eventbrite.com") and parsed.path.startswith("/d/"):
+        return "eventbrite"
+    if host.endswith("allevents.in"):
+        return "all_events"
+    if host.endswith("artidea.org") and "/event/" in parsed.path:
+        return "artidea"
+    if host.endswith("lu.ma") or host.endswith("luma.com"):
+        return "luma"
+    return None
+
+
+def load_fixtures(directory):
+    """Read `<directory>/<kind>/*.html|*.json` into {kind: [(name, text)]}."""
+    corpus = defaultdict(list)
+    for kind in PAGE_KINDS:
+        folder = os.path.join(directory, kind)
+        if not os.path.isdir(folder):
+            continue
+        for name in sorted(os.listdir(folder)):
+            if name.endswith(PAGE_EXTENSIONS):
+                with open(os.path.join(folder, name), encoding="utf-8") as page:
+                    corpus[kind].append((name, page.read()))
+    return corpus
+
+
+def load_response_cache(directory):
+    """Build a corpus from the crawl response cache (`CRAWL_CACHE_DIR`)."""
+    corpus = defaultdict(list)
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            if not name.endswith(".json"):
+                continue
+            meta_path = os.path.join(root, name)
+            try:
+                with open(meta_path) as meta_file:
+                    meta = json.load(meta_file)
+                kind = classify_url(meta.get("url"))
+                if kind is None:
+                    continue
+                with open(meta_path[:-len(".json")] + ".body", "rb") as body_file:
+                    corpus[kind].append((meta["url"], body_file.read().decode("utf-8", "replace")))
+            except (OSError, ValueError, KeyError):
+                continue
+    return corpus
+
+
+class StageTimer:
+    def __init__(self):
+        self.seconds = defaultdict(float)
+
+    def time(self, stage, func, *args):
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.seconds[stage] += time.perf_counter() - started
+
+
+class ScraperBenchmark:
+    """
+    Replays recorded pages through the parse and normalize steps of each
+    scraper without touching the network or the database, and reports
+    throughput, per-stage time and the peak memory allocated per kind.
+
+    Engines are built through their constructors with an offline session,
+    which serves nothing but the response cache, and a checkpoint of their
+    own, so the parsers run with everything a crawl gives them.
+    """
+
+    def __init__(self, corpus, repeat=1, extraction="fast"):
+        self.corpus = corpus
+        self.repeat = max(1, repeat)
+        self.extraction = extraction
+        self.engines = {}
+        # Kinds whose engine is not configured here, with the reason
+        self.skipped = {}
+        self.city = City(
+            city_name=ArtIdeaScraper.CITY_NAME, city_ascii=ArtIdeaScraper.CITY_NAME,
+            timezone="America/New_York")
+
+    def get_engine(self, kind):
+        engine_class = KIND_ENGINES[kind]
+        if engine_class not in self.engines:
+            self.engines[engine_class] = engine_class(
+                extraction=self.extraction,
+                session=CrawlSession(offline=True),
+                checkpoint=CrawlCheckpoint(f"benchmark-{engine_class.EVENT_SOURCE}"),
+            )
+        return self.engines[engine_class]
+
+    @property
+    def eventbrite(self):
+        return self.get_engine("eventbrite")
+
+    @property
+    def allevents(self):
+        return self.get_engine("all_events")
+
+    @property
+    def artidea(self):
+        return self.get_engine("artidea")
+
+    def bench_eventbrite(self, pages, timer):
+        events = 0
+        for _, html in pages:
+            data = timer.time("extract", self.eventbrite.extract_script_data, html)
+            events += len(timer.time(
+                "normalize", self.eventbrite.get_event_ids_from_results, data))
+        return events
+
+    def bench_eventbrite_api(self, pages, timer):
+        details = [timer.time("extract", json.loads, body) for _, body in pages]
+        return len(timer.time("normalize", self.eventbrite.parse_data, details))
+
+    def bench_all_events(self, pages, timer):
+        events = 0
+        for _, html in pages:
+            data = timer.time("extract", self.allevents.extract_events_data, html)
+            if data:
+                events += len(timer.time("normalize", self.allevents.transform_events, data))
+        return events
+
+    def bench_artidea(self, pages, timer):
+        events = 0
+        for name, html in pages:
+            url = name if name.startswith("http") else f"{ArtIdeaScraper.EVENT_BASE_URL}/event/{name}"
+            if timer.time("parse", self.artidea.parse_event_html, html, url, self.city):
+                events += 1
+        return events
+
+    def bench_luma(self, pages, timer):
+        events = 0
+        for name, html in pages:
+            scraper = LumaEventScraper(name)
+            scraper.html = html
+            if timer.time("extract", scraper.extract_json_ld):
+                timer.time("normalize", scraper.normalize_event_data)
+                events += 1
+        return events
+
+    def replay(self, kind, pages, timer):
+        return getattr(self, f"bench_{kind}")(pages, timer)
+
+    def measure_peak_memory(self, kind, pages):
+        """
+        Peak Python memory allocated while `kind` replays its pages once,
+        in MB. Traced in a pass of its own, so tracing does not slow down
+        the timed passes.
+        """
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        try:
+            self.replay(kind, pages, StageTimer())
+            return (tracemalloc.get_traced_memory()[1] - baseline) / 1024 / 1024
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+
+    def run(self, kinds=None):
+        results = []
+        for kind in kinds or PAGE_KINDS:
+            pages = self.corpus.get(kind)
+            if not pages:
+                continue
+            if kind in KIND_ENGINES:
+                try:
+                    self.get_engine(kind)
+                except ImproperlyConfigured as e:
+                    self.skipped[kind] = str(e)
+                    continue
+            timer = StageTimer()
+            events = 0
+            started = time.perf_counter()
+            for _ in range(self.repeat):
+                events += self.replay(kind, pages, timer)
+            seconds = time.perf_counter() - started
+            page_count = len(pages) * self.repeat
+            results.append({
+                "kind": kind,
+                "pages": page_count,
+                "bytes": sum(len(body) for _, body in pages) * self.repeat,
+                "events": events,
+                "seconds": seconds,
+                "pages_per_second": page_count / seconds if seconds else 0,
+                "events_per_second": events / seconds if seconds else 0,
+                "stages": dict(timer.seconds),
+                "peak_memory_mb": self.measure_peak_memory(kind, pages),
+            })
+        return results
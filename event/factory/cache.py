@@ -0,0 +1,163 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from event.app_settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+CACHEABLE_CONTENT_TYPES = ("text/", "application/json", "application/ld+json")
+# The stored body is already decoded, so these no longer describe it.
+DROPPED_HEADERS = ("content-encoding", "transfer-encoding", "content-length")
+
+
+def get_max_age(cache_control):
+    for directive in (cache_control or "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "max-age" and value.strip().isdigit():
+            return int(value)
+    return None
+
+
+class CachedEntry:
+    def __init__(self, meta, body):
+        self.meta = meta
+        self.body = body
+
+    @property
+    def headers(self):
+        return CaseInsensitiveDict(self.meta.get("headers", {}))
+
+    @property
+    def age(self):
+        return time.time() - self.meta.get("stored_at", 0)
+
+    def validators(self):
+        headers = {}
+        if self.headers.get("ETag"):
+            headers["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+    def is_fresh(self, ttl):
+        """
+        An explicit `max-age` from the origin wins. Otherwise entries the
+        origin can revalidate are always revalidated, and entries without
+        validators are trusted for `ttl` seconds.
+        """
+        max_age = get_max_age(self.headers.get("Cache-Control"))
+        if max_age is not None:
+            return self.age < max_age
+        if self.validators():
+            return False
+        return self.age < ttl
+
+    def to_response(self, request=None):
+        response = requests.Response()
+        response.status_code = self.meta.get("status", 200)
+        response.headers = self.headers
+        response._content = self.body
+        response.url = self.meta.get("url")
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.request = request
+        response.from_cache = True
+        return response
+
+
+class ResponseCache:
+    """
+    Persistent GET response cache for scraper fetches. Each entry is a body
+    file plus a JSON metadata file, keyed by a hash of the URL and query
+    parameters. In offline mode every cached entry is served as-is and
+    uncached URLs fail instead of touching the network.
+    """
+
+    def __init__(self, directory, ttl, offline=False):
+        self.directory = str(directory)
+        self.ttl = ttl
+        self.offline = offline
+
+    @staticmethod
+    def make_key(method, url, params=None):
+        prepared = requests.Request(method.upper(), url, params=params).prepare()
+        return hashlib.sha256(
+            f"{prepared.method} {prepared.url}".encode()).hexdigest()
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key[:2], key)
+        return f"{base}.json", f"{base}.body"
+
+    def get(self, key):
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r") as meta_file:
+                meta = json.load(meta_file)
+            with open(body_path, "rb") as body_file:
+                body = body_file.read()
+        except (OSError, ValueError):
+            return None
+        return CachedEntry(meta, body)
+
+    def _write(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+
+    def _store(self, key, meta, body):
+        meta_path, body_path = self._paths(key)
+        try:
+            self._write(body_path, body)
+            self._write(meta_path, json.dumps(meta).encode())
+        except OSError as e:
+            logger.warning(f"Could not write response cache entry {key}: {e}")
+
+    def is_cacheable(self, response):
+        if response.status_code != 200:
+            return False
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return False
+        content_type = response.headers.get("Content-Type", "")
+        return content_type.startswith(CACHEABLE_CONTENT_TYPES)
+
+    def set(self, key, response):
+        if not self.is_cacheable(response):
+            return
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in DROPPED_HEADERS
+        }
+        self._store(key, {
+            "url": response.url,
+            "status": response.status_code,
+            "headers": headers,
+            "stored_at": time.time(),
+        }, response.content)
+
+    def refresh(self, key, entry, not_modified):
+        """Record a 304: keep the body, take any updated validators."""
+        meta = dict(entry.meta)
+        headers = dict(meta.get("headers", {}))
+        for name in ("ETag", "Last-Modified", "Cache-Control", "Expires"):
+            if name in not_modified.headers:
+                headers[name] = not_modified.headers[name]
+        meta["headers"] = headers
+        meta["stored_at"] = time.time()
+        self._store(key, meta, entry.body)
+        return CachedEntry(meta, entry.body)
+
+
+def get_response_cache(offline=False):
+    if not (app_settings.CRAWL_CACHE_ENABLED or offline):
+        return None
+    return ResponseCache(
+        app_settings.CRAWL_CACHE_DIR, app_settings.CRAWL_CACHE_TTL, offline=offline)
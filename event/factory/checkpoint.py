@@ -0,0 +1,224 @@
+import os
+import uuid
+import socket
+import hashlib
+import logging
+import threading
+from datetime import timedelta
+
+from django.db.models import F, Q
+from django.utils import timezone
+
+from event.models import CrawlRun, CrawlWorkItem, CrawlStat
+from event.app_settings import app_settings
+from event.factory.scheduler import next_crawl_interval
+from event.factory.metrics import CrawlMetrics
+
+logger = logging.getLogger(__name__)
+
+
+# CrawlMetrics counters stored as columns on CrawlStat and CrawlRun
+METRIC_FIELDS = (
+    "http_requests", "http_bytes", "cache_hits", "fetch_seconds",
+    "parse_seconds", "persist_seconds", "db_queries", "db_seconds",
+)
+INTEGER_METRICS = ("http_requests", "http_bytes", "cache_hits", "db_queries")
+
+
+def metric_values(metrics):
+    if metrics is None:
+        return {}
+    return {
+        name: int(metrics.counters[name]) if name in INTEGER_METRICS else metrics.counters[name]
+        for name in METRIC_FIELDS
+    }
+
+
+def work_item_key(engine, item):
+    phrase_id = item.search_phrase.pk if item.search_phrase else "-"
+    key = f"{engine}:{phrase_id}:{item.city.pk}"
+    if item.url:
+        key += ":" + hashlib.sha1(item.url.encode()).hexdigest()
+    if item.query:
+        key += ":q" + hashlib.sha1(item.query.encode()).hexdigest()[:16]
+    return key
+
+
+class CrawlCheckpoint:
+    """
+    Persists the progress of a crawl as a `CrawlRun` with one
+    `CrawlWorkItem` per (engine, phrase, city).
+
+    Every item is leased before it is fetched, with a single conditional
+    UPDATE, so two overlapping runs never work on the same city. With
+    `resume=True`, items completed within `window` are skipped, which lets
+    a run that died halfway pick up where it stopped.
+
+    The yield of every crawled item is recorded as a `CrawlStat` and used
+    to compute the item's next due time. With `adaptive=True`, only items
+    that are due get crawled. The item's `CrawlMetrics` are stored on the
+    stat and added up on the run.
+    """
+
+    def __init__(self, engine, resume=False, window=None, lease_seconds=None,
+                 adaptive=False, shard=None):
+        self.engine = engine
+        self.shard = f"{shard[0]}/{shard[1]}" if shard else ""
+        self.resume = resume
+        self.adaptive = adaptive
+        self.window = timedelta(
+            hours=window if window is not None else app_settings.CRAWL_RESUME_WINDOW_HOURS)
+        self.lease = timedelta(
+            seconds=lease_seconds or app_settings.CRAWL_LEASE_SECONDS)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.run = None
+        self._lock = threading.Lock()
+        self._counts = {"completed": 0, "failed": 0, "skipped": 0}
+        self.metrics = CrawlMetrics()
+        # CrawlStat of each released item, by the item's metrics
+        self._stats = {}
+
+    def start(self):
+        self.run = CrawlRun.objects.create(
+            engine=self.engine, owner=self.owner, resume=self.resume, shard=self.shard)
+        logger.info(f"Started crawl run {self.run.pk} as {self.owner} {self.shard}".rstrip())
+        return self.run
+
+    def _count(self, name):
+        with self._lock:
+            self._counts[name] += 1
+
+    def claim(self, item):
+        """Lease a work item for this run; False if it should be skipped."""
+        key = work_item_key(self.engine, item)
+        CrawlWorkItem.objects.get_or_create(
+            key=key,
+            defaults={
+                "engine": self.engine,
+                "search_phrase": item.search_phrase,
+                "city": item.city,
+                "url": item.url,
+            })
+
+        now = timezone.now()
+        claimable = CrawlWorkItem.objects.filter(key=key).filter(
+            Q(leased_until__isnull=True) | Q(leased_until__lt=now) | Q(lease_owner=self.owner))
+        if self.resume:
+            claimable = claimable.exclude(
+                status="completed", last_completed_at__gte=now - self.window)
+        if self.adaptive:
+            claimable = claimable.filter(
+                Q(next_due_at__isnull=True) | Q(next_due_at__lte=now))
+        claimed = claimable.update(
+            status="running",
+            run=self.run,
+            lease_owner=self.owner,
+            leased_until=now + self.lease,
+            attempts=F("attempts") + 1,
+            last_started_at=now,
+        )
+        if not claimed:
+            logger.info(f"Skipping {key}: leased by another run, completed recently or not due")
+            self._count("skipped")
+        return bool(claimed)
+
+    def release(self, item, result=None, error=None, metrics=None):
+        """
+        Record the outcome of a leased item, schedule its next crawl and
+        drop the lease. `result` is the `UpsertResult` of the persist
+        stage, or None when the source returned nothing. An item that
+        returned nothing and recorded request errors is released as failed;
+        events the engine recorded as `events_known` count as unchanged.
+        """
+        # Events the engine found already stored and did not fetch again
+        known = int(metrics.counters["events_known"]) if metrics is not None else 0
+        if error is None and result is None and not known and metrics is not None and metrics.errors:
+            # Engines swallow transport errors and return nothing; a crawl
+            # that got nothing because its requests failed is a failure to
+            # retry soon, not an idle crawl to back off from.
+            error = "Requests failed: " + ", ".join(
+                f"{name} x{count}" for name, count in sorted(metrics.errors.items()))
+        created = len(result.created) if result else 0
+        updated = len(result.updated) if result else 0
+        skipped = len(result.skipped) if result else 0
+        if metrics is not None:
+            self.metrics.merge(metrics)
+        self.metrics.add("events_created", created)
+        self.metrics.add("events_updated", updated)
+        self.metrics.add("events_skipped", skipped)
+
+        row = CrawlWorkItem.objects.filter(
+            key=work_item_key(self.engine, item), lease_owner=self.owner).first()
+        if row is None:
+            return
+        stat = CrawlStat.objects.create(
+            work_item=row,
+            run=self.run,
+            created=created,
+            unchanged=updated + skipped + known,
+            updated=updated,
+            skipped=skipped,
+            empty=result is None and error is None and not known,
+            failed=error is not None,
+            wall_seconds=metrics.wall_seconds if metrics else 0,
+            errors=dict(metrics.errors) if metrics else {},
+            **metric_values(metrics),
+        )
+        if metrics is not None:
+            with self._lock:
+                self._stats[metrics] = stat.pk
+        now = timezone.now()
+        history = list(row.stats.all()[:app_settings.CRAWL_ADAPTIVE_HISTORY])
+        fields = {
+            "lease_owner": None,
+            "leased_until": None,
+            "next_due_at": now + next_crawl_interval(self.engine, history),
+        }
+        if error is None:
+            fields.update(status="completed", last_completed_at=now, last_error=None)
+        else:
+            fields.update(status="failed", last_error=str(error)[:2000])
+        CrawlWorkItem.objects.filter(pk=row.pk, lease_owner=self.owner).update(**fields)
+        self._count("completed" if error is None else "failed")
+
+    def record_images(self, downloaded_by):
+        """
+        Store image downloads, counted by the metrics of the item that
+        queued them, on that item's `CrawlStat`. Downloads finish after
+        their item is released, so this runs once the image pipeline has
+        drained.
+        """
+        for metrics, downloaded in downloaded_by.items():
+            stat_id = self._stats.get(metrics)
+            if stat_id is not None and downloaded:
+                CrawlStat.objects.filter(pk=stat_id).update(images_downloaded=downloaded)
+
+    def summary(self):
+        return {"run": self.run.pk if self.run else None, "shard": self.shard, **self._counts}
+
+    def finish(self, error=None):
+        if self.run is None:
+            return
+        CrawlRun.objects.filter(pk=self.run.pk).update(
+            status="failed" if error else "completed",
+            finished_at=timezone.now(),
+            items_completed=self._counts["completed"],
+            items_failed=self._counts["failed"],
+            items_skipped=self._counts["skipped"],
+            events_created=self.metrics.counters["events_created"],
+            events_updated=self.metrics.counters["events_updated"],
+            events_skipped=self.metrics.counters["events_skipped"],
+            images_downloaded=self.metrics.counters["images_downloaded"],
+            errors=dict(self.metrics.errors),
+            **metric_values(self.metrics),
+        )
+        # Leases of items this run never finished expire on their own, but
+        # releasing them now lets the next run pick them up straight away.
+        CrawlWorkItem.objects.filter(
+            lease_owner=self.owner, status="running"
+        ).update(status="pending", lease_owner=None, leased_until=None)
+        logger.info(
+            f"Crawl run {self.run.pk} finished: {self._counts['completed']} completed, "
+            f"{self._counts['failed']} failed, {self._counts['skipped']} skipped, "
+            f"{self.metrics.counters['http_requests']} requests, "
+            f"{self.metrics.counters['events_created']} events created")
@@ -1,22 +1,33 @@
 
 from decimal import Decimal, ROUND_HALF_UP
+from contextlib import nullcontext
+from functools import cached_property
 import pytz
-import random
-from ..factory.user_agents import user_agents
-from collections import namedtuple
 import json
-import time
 from bs4 import BeautifulSoup
 import re
 import requests
 import logging
 from datetime import datetime, date
-from io import BytesIO
-from PIL import Image
-from django.core.files.base import ContentFile
+from urllib.parse import parse_qsl, urlparse
 from django.utils.text import slugify
-from event.models import Event, SearchPhrase, Country, City, ZipCode, Location
+from event.models import SearchPhrase, City, Location
 from event.app_settings import app_settings
+from event.factory.executor import CrawlExecutor, WorkItem
+from event.factory.http import CrawlSession
+from event.factory.archive import ResponseArchive
+from event.factory.checkpoint import CrawlCheckpoint
+from event.factory.extract import extract_assigned_json
+from event.factory.geo import GeoResolver, geohash
+from event.factory.images import ImagePipeline
+from event.factory.metrics import collect, current_metrics, record
+from event.factory.pages import PageHarvester
+from event.factory.pipeline import CrawlPipeline, Stage
+from event.factory.planner import CrawlPlanner, city_shard, normalize_query
+from event.factory.rate_limit import RateLimiter
+from event.factory.persistence import (
+    build_event, bulk_upsert_events, event_key, get_known_external_ids,
+    normalize_external_id)
 from django.contrib.gis.geos import Point
 
 logging.basicConfig(level=logging.INFO)
@@ -26,13 +37,35 @@ logger = logging.getLogger(__name__)
 class BaseEngine:
     BASE_URL = ""
     API_KEY = ""
-
-    def construct_query(self, search_phrase: SearchPhrase):
-        return [
-            f"{search_phrase.query} events in {city.city_ascii}, {city.region.state_code}"
-            for location in search_phrase.get_locations
-            for city in location.get_cities()
-        ]
+    EVENT_SOURCE = "serp_api_google_event"
+    # How many phrases the planner may merge into one query for a city
+    MAX_PHRASES_PER_QUERY = 1
+
+    def __init__(self, concurrency=None, per_host_concurrency=None, offline=False,
+                 resume=False, resume_window=None, adaptive=False, shard=None,
+                 extraction=None, max_pages=None, archive=False, session=None, checkpoint=None):
+        self.concurrency = concurrency or app_settings.CRAWL_CONCURRENCY
+        # "fast" decodes embedded JSON in place, "soup" parses the whole page
+        self.extraction = extraction or app_settings.CRAWL_EXTRACTION_MODES.get(
+            self.EVENT_SOURCE, "fast")
+        # Listing pages walked per work item by engines that paginate
+        self.max_pages = max_pages or app_settings.CRAWL_MAX_PAGES.get(
+            self.EVENT_SOURCE, 1)
+        # (index, total), 1-based: only cities hashed to `index` are crawled
+        self.shard = shard
+        # `session` and `checkpoint` may be injected, e.g. by the offline benchmark
+        self.session = session or CrawlSession(
+            per_host_concurrency=per_host_concurrency,
+            pool_size=self.concurrency,
+            rate_limiter=RateLimiter(share=1 / shard[1]) if shard else None,
+            offline=offline,
+            archive=ResponseArchive(app_settings.CRAWL_ARCHIVE_DIR, self.EVENT_SOURCE)
+            if archive or app_settings.CRAWL_ARCHIVE_ENABLED else None)
+        self.images = ImagePipeline(session=self.session)
+        self.geo = GeoResolver()
+        self.checkpoint = checkpoint or CrawlCheckpoint(
+            self.EVENT_SOURCE, resume=resume, window=resume_window,
+            adaptive=adaptive, shard=shard)
 
     def fetch_data(self, query):
         raise NotImplementedError(
@@ -57,76 +90,190 @@ class BaseEngine:
     def format_venue(self, address):
         return ", ".join(address) if isinstance(address, list) else address
 
-    def download_image(self, image_url, title):
-        if image_url:
-            try:
-                response = requests.get(image_url)
-                response.raise_for_status()
-                img = Image.open(BytesIO(response.content))
-                img = img.convert("RGB")
-                img_io = BytesIO()
-                img.save(img_io, format='JPEG')
-                filename = f"{slugify(title)}.jpg"
-                logger.info(f"Image downloaded successfully: {filename}")
-                return ContentFile(img_io.getvalue(), name=filename)
-            except Exception as e:
-                logger.error(f"Failed to download image {image_url}: {e}")
-        return None
+    def save_events(self, rows, event_source="serp_api_google_event"):
+        """Persist a page of (event_data, city) pairs in one upsert."""
+        events, images = [], {}
+        for data, city in rows:
+            event = build_event(
+                {**data, "venue": self.format_venue(data.get("venue"))}, city, event_source)
+            if event:
+                events.append(event)
+                images[event_key(event)] = data.get("image")
+
+        result = bulk_upsert_events(events)
+        for event in result.created:
+            self.images.submit(event.pk, images.get(event_key(event)))
+        return result
 
     def save_event(self, event_data, city, event_source="serp_api_google_event"):
         if city:
-            for data in event_data:
-
-                event, created = Event.objects.get_or_create(
-                    title=data["title"],
-                    start_date=data["start_date"],
-                    # when=data["when"],
-                    city=city,
-                    defaults={
-                        "description": data.get("description", ""),
-                        "venue": self.format_venue(data.get("venue")),
-                        "link": data.get("link"),
-                        "event_source": event_source,
-                        "valid": True,
-                    },
-                )
-                event_image = None
-                if created:
-                    event_image = self.download_image(
-                        data.get("image"), data.get("title"))
-
-                if event_image:
-                    event.event_image = event_image
-                    event.save()
-                    logger.info(f"Image linked to event: {event.title}")
-                logger.info(
-                    f"Event {'created' if created else 'updated'}: {event.title}")
-            return event, created
+            return self.save_events(
+                [(data, city) for data in event_data], event_source)
+
+    def resolve_location(self, address_data):
+        """
+        Resolve an address with `city`, `region` (state code), `country`
+        (ISO2), `postal_code`, `latitude` and `longitude` to (country,
+        region, city), creating the places that do not exist yet.
+        """
+        city_name = address_data.get("city")
+        region_code = address_data.get("region", "").strip().upper()
+        country_code = address_data.get("country", "").strip().upper()
+        zip_code = address_data.get("postal_code")
+
+        if not (city_name and region_code and country_code):
+            return None, None, None
+
+        EIGHT_PLACES = Decimal("0.00000001")
+
+        try:
+            lat = Decimal(str(address_data.get("latitude", "0.0"))).quantize(EIGHT_PLACES, rounding=ROUND_HALF_UP)
+            lng = Decimal(str(address_data.get("longitude", "0.0"))).quantize(EIGHT_PLACES, rounding=ROUND_HALF_UP)
+        except:
+            lat = Decimal("0.0").quantize(EIGHT_PLACES)
+            lng = Decimal("0.0").quantize(EIGHT_PLACES)
+
+        country = self.geo.get_country(
+            iso2=country_code,
+            defaults={
+                "iso2_code": country_code,
+                "iso3_code": country_code,
+                "country_name": country_code
+            }
+        )
+
+        region = self.geo.get_region(
+            country,
+            state_code=region_code,
+            defaults={
+                "state_code": region_code,
+                "state_name": region_code,
+                "short_name": region_code,
+                "timezone": "America/New_York",
+                "lat": lat,
+                "lng": lng,
+                "active": False
+            }
+        )
+
+        city_name_clean = city_name.strip().title()
+        city = self.geo.get_city(
+            region,
+            city_name_clean,
+            defaults={
+                "city_name": city_name_clean,
+                "lat": lat,
+                "lng": lng,
+                "coords": Point(float(lng), float(lat)),
+                "active": False,
+                "timezone": region.timezone
+            }
+        )
+
+        if zip_code:
+            self.geo.add_zip_code(city, region, zip_code)
+
+        return country, region, city
+
+    def plan_key(self, city, query):
+        """Identify the request a (city, phrase) pair turns into; None skips it."""
+        return (normalize_query(query), city.city_ascii.casefold(), city.region.state_code.upper())
+
+    def combine_queries(self, queries):
+        return " OR ".join(queries)
+
+    def item_query(self, item: WorkItem):
+        return item.query or item.search_phrase.query
+
+    def build_query(self, item: WorkItem):
+        return f"{self.item_query(item)} events in {item.city.city_ascii}, {item.location.state_code}"
+
+    def fetch_item(self, item: WorkItem):
+        """Fetch stage: network I/O only, returns the raw payload."""
+        query = self.build_query(item)
+        logger.info(f"Processing query: {query}")
+        return self.fetch_data(query)
+
+    def parse_item(self, item: WorkItem, payload):
+        """Parse stage: turn a payload into event dicts without touching the DB."""
+        return self.parse_data(payload)
+
+    def persist_item(self, item: WorkItem, events):
+        """Persist stage: resolve locations and upsert the page."""
+        return self.save_event(events, item.city)
+
+    def get_pipeline(self):
+        return CrawlPipeline([
+            Stage("fetch", self.fetch_item, self.concurrency),
+            Stage("parse", self.parse_item, app_settings.CRAWL_PARSE_WORKERS),
+            Stage("persist", self.persist_item, app_settings.CRAWL_PERSIST_WORKERS),
+        ], queue_size=app_settings.CRAWL_PIPELINE_QUEUE_SIZE,
+            name=self.__class__.__name__, on_done=self.checkpoint.release)
+
+    def harvest_pages(self, fetch_page, key):
+        """Walk up to `max_pages` listing pages, see `PageHarvester`."""
+        return PageHarvester(
+            fetch_page,
+            known_keys=lambda entries: get_known_external_ids(
+                self.EVENT_SOURCE, [key(entry) for entry in entries]),
+            key=lambda entry: normalize_external_id(key(entry)),
+            max_pages=self.max_pages,
+            workers=app_settings.CRAWL_PAGE_WORKERS,
+            name=f"{self.EVENT_SOURCE}-pages",
+        ).run()
+
+    def replay_response(self, url, body):
+        """
+        Parse an archived response with the current parsers and persist
+        its events. Returns the `UpsertResult`, or None when this engine
+        cannot replay the URL on its own (e.g. a search page that only
+        lists IDs).
+        """
+        return None
+
+    def in_shard(self, item: WorkItem):
+        return self.shard is None or city_shard(item.city.pk, self.shard[1]) == self.shard[0]
+
+    def run_work_items(self, items):
+        self.checkpoint.start()
+        error = None
+        try:
+            return self.get_pipeline().run(
+                item for item in items
+                if self.in_shard(item) and self.checkpoint.claim(item))
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.geo.flush()
+            self.images.close()
+            if self.session.archive is not None:
+                self.session.archive.close()
+            self.checkpoint.metrics.add("images_downloaded", self.images.downloaded)
+            self.checkpoint.record_images(self.images.downloaded_by)
+            if self.images.failed:
+                self.checkpoint.metrics.error("ImageDownloadError", self.images.failed)
+            self.checkpoint.finish(error)
 
     def process(self, search_phrase: SearchPhrase):
-        for location in search_phrase.get_locations:
-            for city in location.get_cities():
-                query = f"{search_phrase.query} events in {city.city_ascii}, {location.state_code}"
-                logger.info(f"Processing query: {query}")
-                response = self.fetch_data(query)
-                if response:
-                    event_data = self.parse_data(response)
-                    self.save_event(event_data, city)
+        self.run_work_items(CrawlPlanner(self).build(
+            SearchPhrase.objects.filter(pk=search_phrase.pk)))
 
     def fetch_events(self):
-        for query in SearchPhrase.objects.filter(active=True):
-            self.process(query)
+        self.run_work_items(CrawlPlanner(self).build())
 
 
 class SerpAPIGoogleEngine(BaseEngine):
     BASE_URL = app_settings.SERP_API_ENDPOINT
     API_KEY = app_settings.SERP_API_KEY
+    MAX_PHRASES_PER_QUERY = app_settings.CRAWL_PLAN_SERP_PHRASES_PER_QUERY
 
     def fetch_data(self, query):
         params = {"api_key": self.API_KEY, "q": query,
                   "engine": "google_events", "hl": 'en', "gl": "us"}
         try:
-            response = requests.get(self.BASE_URL, params=params)
+            response = self.session.get(
+                self.BASE_URL, params=params, timeout=120)
             response.raise_for_status()
             return response.json() if 'error' not in response.json() else False
         except requests.RequestException as e:
@@ -137,6 +284,17 @@ class SerpAPIGoogleEngine(BaseEngine):
                 logger.error(f"Request error: {e}")
             return False
 
+    def replay_response(self, url, body):
+        # The city is only known from the query, see `build_query`
+        query = dict(parse_qsl(urlparse(url).query)).get("q", "")
+        _, _, place = query.rpartition(" events in ")
+        city_name, _, state_code = place.rpartition(", ")
+        city = self.geo.get_city(self.geo.get_region(state_code=state_code), city_name)
+        if city is None:
+            logger.warning(f"Cannot replay {url}: city of query {query!r} not found")
+            return None
+        return self.save_event(self.parse_data(json.loads(body)), city)
+
     def parse_data(self, data):
         events = []
         for item in data.get("events_results", []):
@@ -147,299 +305,123 @@ class SerpAPIGoogleEngine(BaseEngine):
                 "description": item.get("description", ""),
                 "venue": item.get("address"),
                 "link": item.get("link"),
+                "external_id": item.get("link"),
                 "image": item.get("image"),
             })
         return events
 
 
 class EventbriteWebScraperPlusAPI(BaseEngine):
-    def __init__(self):
-        self.html_content = None
-        self.server_data = None
-        self.BASE_URL = app_settings.EVENTBRITE_API_ENDPOINT
-        self.API_KEY = app_settings.EVENTBRITE_API_KEY
-        self.RATE_LIMIT_WAIT = 5
-        self.HTML_RATE_LIMIT_WAIT = 30
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": random.choice(user_agents)
-        })
-
-    def construct_query(self, search_phrase: SearchPhrase):
-        Search = namedtuple("Search", ['search', 'cities'])
-        search = slugify(f"{search_phrase.query}")
-        cities = [
-            city for location in search_phrase.get_locations
-            for city in location.get_cities() if city.get_eventbrite_slug
-        ]
-        return Search(search, cities)
-
-    def fetch_html(self, url: str):
-        try:
-            time.sleep(self.HTML_RATE_LIMIT_WAIT)
-            response = self.session.get(url, timeout=120)
-            response.raise_for_status()
-            self.html_content = response.text
-            logger.info("Successfully fetched HTML content.")
-            return True
-        except requests.RequestException as e:
-            logger.error(f"Error fetching HTML: {e}")
-            return False
-
-    def extract_script_data(self):
-        if not self.html_content:
-            return False
-
-        soup = BeautifulSoup(self.html_content, "html.parser")
-        script_tag = soup.find(
-            "script", text=re.compile(r"window\.__SERVER_DATA__"))
-        if not script_tag:
-            return False
-
-        match = re.search(
-            r"window\.__SERVER_DATA__\s*=\s*({.*?});", script_tag.string, re.DOTALL)
-        if not match:
-            return False
-
-        try:
-            self.server_data = json.loads(match.group(1))
-            return True
-        except json.JSONDecodeError:
-            return False
-
-    def get_event_ids_from_results(self):
-        if not self.server_data:
-            return []
-        events = self.server_data.get("search_data", {}).get(
-            "events", {}).get("results", [])
-        return [event.get("id") for event in events if event.get("id")]
-
-    def get_event_id(self, search_url):
-        if self.fetch_html(search_url) and self.extract_script_data():
-            return self.get_event_ids_from_results()
-        return []
-
-    def fetch_data(self, query):
-        event_ids = self.get_event_id(query)
-        if not event_ids:
-            return []
-
-        headers = {"Authorization": f"Bearer {self.API_KEY}"}
-        params = {"expand": "venue"}
-        events_json = []
-        for event_id in event_ids:
-            try:
-                response = self.session.get(
-                    f"{self.BASE_URL}{event_id}/", params=params, headers=headers)
-                response.raise_for_status()
-                events_json.append(response.json())
-                time.sleep(self.RATE_LIMIT_WAIT)
-            except requests.RequestException as e:
-                logger.error(
-                    f"Error fetching data for event '{event_id}': {e}")
-        return events_json
-
-    def parse_data(self, events_list: list):
-        events = []
-        for event in events_list:
-            start_date_str = event['start'].get("utc")
-            event_timezone = event['start'].get("timezone")
-            start_date = datetime.strptime(
-                start_date_str, "%Y-%m-%dT%H:%M:%SZ") if start_date_str else None
-
-            if start_date:
-                tz_aware = pytz.utc.localize(start_date)
-                start_date_in_timezone = tz_aware.astimezone(
-                    pytz.timezone(event_timezone))
-                when = start_date_in_timezone.strftime(
-                    "%B %d, %Y at %I:%M %p %Z")
-            else:
-                when = None
+    EVENT_SOURCE = "eventbrite"
 
-            events.append({
-                "title": event['name'].get("text"),
-                "start_date": start_date,
-                # "when": when,
-                "description": event.get("summary", ""),
-                "venue": event['venue']['address'].get("localized_address_display"),
-                "link": event.get("url"),
-                "image": event['logo'].get("url") if event.get("logo") else None,
-                "venue_raw": event['venue'],
-            })
-        return events
-
-    def process(self, search_phrase: SearchPhrase):
-        search_query = self.construct_query(search_phrase)
-        for location in search_phrase.get_locations:
-            for _city in location.get_cities():
-                search_url = f"https://www.eventbrite.com/d/{_city.get_eventbrite_slug}/{search_query.search}/?page=1&lang=en"
-                logger.info(f"Processing search: {search_url}")
-                response = self.fetch_data(search_url)
-                if not response:
-                    continue
-
-                event_data_list = self.parse_data(response)
-                for event_data in event_data_list:
-                    venue = event_data.pop("venue_raw", None)
-                    if not venue:
-                        continue
-
-                    address = venue.get('address', {})
-                    city_name = address.get("city")
-                    region_code = address.get("region").strip(
-                    ).upper() if address.get("region") else None
-                    lat_str = address.get("latitude")
-                    lng_str = address.get("longitude")
-                    zip_code = address.get("postal_code")
-                    country_code = address.get("country", "US").strip(
-                    ).upper() if address.get("country") else "US"
-
-                    if not city_name or not region_code:
-                        logger.warning(
-                            f"Missing city/state info for event: {event_data.get('title')}")
-                        continue
-
-                    try:
-                        lat = Decimal(lat_str)
-                        lng = Decimal(lng_str)
-                    except Exception:
-                        logger.warning(
-                            f"Invalid coordinates for city {city_name}")
-                        lat, lng = Decimal("0.0"), Decimal("0.0")
-
-                    region = location
-
-                    region, _ = Location.objects.get_or_create(
-                        state_code__iexact=region_code,
-                        country__iso2_code__iexact=country_code,
-                        defaults={
-                            "state_code": region_code,
-                            "state_name": region.state_name,
-                            "short_name": region.short_name,
-                            "timezone": region.timezone,
-                            "lat": region.lat,
-                            "lng": region.lng,
-                            "country": region.country,
-                            "active": False
-                        }
-                    )
-
-                    city_name = city_name.strip().title()
-                    matched_city, _ = City.objects.get_or_create(
-                        city_ascii__iexact=city_name,
-                        region__state_code=region_code,
-                        defaults={
-                            "region": region,
-                            "city_name": city_name,
-                            "city_ascii": city_name,
-                            "lat": lat,
-                            "lng": lng,
-                            "coords": Point(float(lng), float(lat)),
-                            "active": False,
-                            "timezone": region.timezone
-                        }
-                    )
-
-                    if zip_code:
-                        area_code, _ = ZipCode.objects.get_or_create(
-                            zip_code=zip_code,
-                            defaults={
-                                "city": matched_city,
-                                "state": region,
-                            }
-                        )
-                        matched_city.area_code.add(area_code)
-                        matched_city.save()
-
-                    self.save_event([event_data], matched_city, "eventbrite")
-
-
-class EventbriteWebScraperPlusAPI(BaseEngine):
-    def __init__(self):
-        self.html_content = None
-        self.server_data = None
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.BASE_URL = app_settings.EVENTBRITE_API_ENDPOINT
         self.API_KEY = app_settings.EVENTBRITE_API_KEY
-        self.RATE_LIMIT_WAIT = 5
-        self.HTML_RATE_LIMIT_WAIT = 30
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": random.choice(user_agents)
-        })
-
-    def construct_query(self, search_phrase: SearchPhrase):
-        Search = namedtuple("Search", ['search', 'cities'])
-        search = slugify(f"{search_phrase.query}")
-        cities = [
-            city for location in search_phrase.get_locations
-            for city in location.get_cities() if city.get_eventbrite_slug
-        ]
-        return Search(search, cities)
 
     def fetch_html(self, url: str):
         try:
-            time.sleep(self.HTML_RATE_LIMIT_WAIT)
             response = self.session.get(url, timeout=120)
             response.raise_for_status()
-            self.html_content = response.text
             logger.info("Successfully fetched HTML content.")
-            return True
+            return response.text
         except requests.RequestException as e:
             logger.error(f"Error fetching HTML: {e}")
-            return False
+            return None
 
-    def extract_script_data(self):
-        if not self.html_content:
-            return False
+    def extract_script_data(self, html_content):
+        if not html_content:
+            return None
 
-        soup = BeautifulSoup(self.html_content, "html.parser")
+        if self.extraction == "fast":
+            server_data = extract_assigned_json(
+                html_content, "window.__SERVER_DATA__", dict)
+            if server_data is not None:
+                return server_data
+            logger.info("Fast extraction of __SERVER_DATA__ failed, parsing the full page.")
+
+        soup = BeautifulSoup(html_content, "html.parser")
         script_tag = soup.find(
             "script", text=re.compile(r"window\.__SERVER_DATA__"))
         if not script_tag:
-            return False
+            return None
 
         match = re.search(
             r"window\.__SERVER_DATA__\s*=\s*({.*?});", script_tag.string, re.DOTALL)
         if not match:
-            return False
+            return None
 
         try:
-            self.server_data = json.loads(match.group(1))
-            return True
+            return json.loads(match.group(1))
         except json.JSONDecodeError:
-            return False
+            return None
 
-    def get_event_ids_from_results(self):
-        if not self.server_data:
+    def get_event_ids_from_results(self, server_data):
+        if not server_data:
             return []
-        events = self.server_data.get("search_data", {}).get(
+        events = server_data.get("search_data", {}).get(
             "events", {}).get("results", [])
         return [event.get("id") for event in events if event.get("id")]
 
-    def get_event_id(self, search_url):
-        if self.fetch_html(search_url) and self.extract_script_data():
-            return self.get_event_ids_from_results()
-        return []
+    def get_page_count(self, server_data):
+        if not server_data:
+            return None
+        pagination = server_data.get("search_data", {}).get(
+            "events", {}).get("pagination") or {}
+        return pagination.get("page_count")
+
+    def fetch_search_page(self, search_url, page):
+        server_data = self.extract_script_data(
+            self.fetch_html(f"{search_url}?page={page}&lang=en"))
+        return self.get_event_ids_from_results(server_data), self.get_page_count(server_data)
 
     def fetch_data(self, query):
-        event_ids = self.get_event_id(query)
+        """Collect event IDs from the search pages at `query`, then fetch the new ones."""
+        event_ids, known_ids = self.harvest_pages(
+            lambda page: self.fetch_search_page(query, page), key=str)
+        event_ids = [
+            event_id for event_id in dict.fromkeys(event_ids)
+            if normalize_external_id(event_id) not in known_ids]
+        if known_ids:
+            logger.info(
+                f"Skipping {len(known_ids)} Eventbrite events already stored.")
+            # Stored as unchanged on the item's CrawlStat
+            record("events_known", len(known_ids))
         if not event_ids:
             return []
 
+        return self.fetch_event_details(event_ids)
+
+    def fetch_event_details(self, event_ids):
+        """
+        Fetch the API record of every event ID, `EVENTBRITE_DETAIL_WORKERS`
+        at a time. The API has no endpoint taking several IDs, so the
+        requests run concurrently instead, throttled by the session's rate
+        budget for the API host. Results keep the order of `event_ids`.
+        """
         headers = {"Authorization": f"Bearer {self.API_KEY}"}
         params = {"expand": "venue"}
-        events_json = []
-        for event_id in event_ids:
-            try:
-                response = self.session.get(
-                    f"{self.BASE_URL}{event_id}/", params=params, headers=headers)
-                response.raise_for_status()
-                events_json.append(response.json())
-                time.sleep(self.RATE_LIMIT_WAIT)
-            except requests.RequestException as e:
-                logger.error(
-                    f"Error fetching data for event '{event_id}': {e}")
-        return events_json
+        metrics = current_metrics()
+        details = {}
+
+        def fetch_detail(event_id):
+            # Count the request against the work item on whose behalf the
+            # detail is fetched, not the detail worker thread.
+            with collect(metrics) if metrics else nullcontext():
+                try:
+                    response = self.session.get(
+                        f"{self.BASE_URL}{event_id}/", params=params, headers=headers)
+                    response.raise_for_status()
+                    details[event_id] = response.json()
+                except requests.RequestException as e:
+                    logger.error(
+                        f"Error fetching data for event '{event_id}': {e}")
+
+        CrawlExecutor(
+            min(app_settings.EVENTBRITE_DETAIL_WORKERS, len(event_ids)),
+            name="eventbrite-details",
+        ).run(event_ids, fetch_detail)
+        return [details[event_id] for event_id in event_ids if event_id in details]
 
     def parse_data(self, events_list: list):
         events = []
@@ -465,150 +447,79 @@ class EventbriteWebScraperPlusAPI(BaseEngine):
                 "description": event.get("summary", ""),
                 "venue": event['venue']['address'].get("localized_address_display"),
                 "link": event.get("url"),
+                "external_id": event.get("id"),
                 "image": event['logo'].get("url") if event.get("logo") else None,
                 "venue_raw": event['venue'],
             })
         return events
 
-    def resolve_location(self, address_data):
-        city_name = address_data.get("city")
-        region_code = address_data.get("region", "").strip().upper()
-        country_code = address_data.get("country", "").strip().upper()
-        zip_code = address_data.get("postal_code")
-
-        if not (city_name and region_code and country_code):
-            return None, None, None
-
-        EIGHT_PLACES = Decimal("0.00000001")
-
-        try:
-            lat = Decimal(str(address_data.get("latitude", "0.0"))).quantize(EIGHT_PLACES, rounding=ROUND_HALF_UP)
-            lng = Decimal(str(address_data.get("longitude", "0.0"))).quantize(EIGHT_PLACES, rounding=ROUND_HALF_UP)
-        except:
-            lat = Decimal("0.0").quantize(EIGHT_PLACES)
-            lng = Decimal("0.0").quantize(EIGHT_PLACES)
-
-        country, _ = Country.objects.get_or_create(
-            iso2_code__iexact=country_code,
-            defaults={
-                "iso2_code": country_code,
-                "iso3_code": country_code,
-                "country_name": country_code
-            }
-        )
-
-        region, _ = Location.objects.get_or_create(
-            state_code__iexact=region_code,
-            country=country,
-            defaults={
-                "state_code": region_code,
-                "state_name": region_code,
-                "short_name": region_code,
-                "timezone": "America/New_York",
-                "lat": lat,
-                "lng": lng,
-                "active": False
-            }
-        )
-
-        city_name_clean = city_name.strip().title()
-        city, _ = City.objects.get_or_create(
-            city_ascii__iexact=city_name_clean,
-            region=region,
-            defaults={
-                "city_name": city_name_clean,
-                "lat": lat,
-                "lng": lng,
-                "coords": Point(float(lng), float(lat)),
-                "active": False,
-                "timezone": region.timezone
-            }
-        )
-
-        if zip_code:
-            zip_obj, _ = ZipCode.objects.get_or_create(
-                zip_code=zip_code,
-                defaults={
-                    "city": city,
-                    "state": region
-                }
-            )
-            city.area_code.add(zip_obj)
-            city.save()
-
-        return country, region, city
+    def replay_response(self, url, body):
+        # Search pages only list IDs; the API records hold the events
+        if not urlparse(url).netloc.endswith("eventbriteapi.com"):
+            return None
+        return self.persist_item(None, self.parse_data([json.loads(body)]))
+
+    def plan_key(self, city, query):
+        return (slugify(query), city.get_eventbrite_slug)
+
+    def fetch_item(self, item: WorkItem):
+        search = slugify(self.item_query(item))
+        search_url = f"https://www.eventbrite.com/d/{item.city.get_eventbrite_slug}/{search}/"
+        logger.info(f"Processing search: {search_url}")
+        return self.fetch_data(search_url)
+
+    def persist_item(self, item: WorkItem, events):
+        rows = []
+        for event_data in events:
+            venue = event_data.pop("venue_raw", None)
+            if not venue:
+                continue
 
-    def process(self, search_phrase: SearchPhrase):
-        search_query = self.construct_query(search_phrase)
-        for location in search_phrase.get_locations:
-            for _city in location.get_cities():
-                search_url = f"https://www.eventbrite.com/d/{_city.get_eventbrite_slug}/{search_query.search}/?page=1&lang=en"
-                logger.info(f"Processing search: {search_url}")
-                response = self.fetch_data(search_url)
-                if not response:
-                    continue
-
-                event_data_list = self.parse_data(response)
-                for event_data in event_data_list:
-                    venue = event_data.pop("venue_raw", None)
-                    if not venue:
-                        continue
-
-                    address = venue.get('address', {})
-                    result = self.resolve_location(address)
-                    if not result:
-                        logger.warning(
-                            f"Skipping event due to unresolved location: {event_data.get('title')}")
-                        continue
-
-                    country, region, city = result
-                    self.save_event([event_data], city, "eventbrite")
+            address = venue.get('address', {})
+            country, region, city = self.resolve_location(address)
+            if not city:
+                logger.warning(
+                    f"Skipping event due to unresolved location: {event_data.get('title')}")
+                continue
+            rows.append((event_data, city))
+        return self.save_events(rows, "eventbrite")
 
 
 class AlleventsInScraper(BaseEngine):
     BASE_URL = "https://allevents.in"
-    RATE_LIMIT_WAIT = 5
-
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": random.choice(user_agents)})
-        self.html_content = None
-        self.events_data = []
-
-    def construct_query(self, search_phrase: SearchPhrase):
-        # Return namedtuple with search slug and cities list similar to Eventbrite scraper
-        Search = namedtuple("Search", ['search', 'cities'])
-        search_slug = slugify(search_phrase.query)
-        cities = [
-            city for location in search_phrase.get_locations
-            for city in location.get_cities() if city.city_ascii
-        ]
-        return Search(search_slug, cities)
+    EVENT_SOURCE = "all_events_in"
 
     def fetch_html(self, url: str):
         try:
-            time.sleep(self.RATE_LIMIT_WAIT)
             response = self.session.get(url, timeout=120)
             response.raise_for_status()
-            self.html_content = response.text
             logger.info(f"Fetched HTML from {url}")
-            return True
+            return response.text
         except requests.RequestException as e:
             logger.error(f"Error fetching HTML from {url}: {e}")
-            return False
+            return None
 
-    def extract_events_data(self):
-        if not self.html_content:
+    def extract_events_data(self, html_content):
+        if not html_content:
             logger.warning("No HTML content to extract from.")
-            return False
+            return None
+
+        if self.extraction == "fast":
+            events_data = extract_assigned_json(
+                html_content, "_this.events_data", list)
+            if events_data is not None:
+                logger.info(
+                    f"Extracted {len(events_data)} events from allevents.in")
+                return events_data
+            logger.info("Fast extraction of _this.events_data failed, parsing the full page.")
 
-        soup = BeautifulSoup(self.html_content, "html.parser")
+        soup = BeautifulSoup(html_content, "html.parser")
         scripts = soup.find_all(
             "script", string=re.compile(r"_this\.events_data\s*=")
         )
         if not scripts:
             logger.warning("No <script> tag with _this.events_data found.")
-            return False
+            return None
 
         script_text = None
         for script in scripts:
@@ -618,29 +529,29 @@ class AlleventsInScraper(BaseEngine):
 
         if not script_text:
             logger.warning("Script with _this.events_data not found.")
-            return False
+            return None
 
         match = re.search(
             r'_this\.events_data\s*=\s*(\[\{.*?\}\]);', script_text, re.DOTALL)
         if not match:
             logger.warning("Failed to extract _this.events_data JSON block.")
-            return False
+            return None
 
         raw_json = match.group(1)
         cleaned_json = raw_json.replace("undefined", "null")
 
         try:
-            self.events_data = json.loads(cleaned_json)
+            events_data = json.loads(cleaned_json)
             logger.info(
-                f"Extracted {len(self.events_data)} events from allevents.in")
-            return True
+                f"Extracted {len(events_data)} events from allevents.in")
+            return events_data
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error: {e}")
-            return False
+            return None
 
-    def transform_events(self):
+    def transform_events(self, events_data):
         result = []
-        for event in self.events_data:
+        for event in events_data:
             venue = event.get("venue", {})
             # Convert Unix timestamp string to datetime if possible
             start_time = None
@@ -663,6 +574,7 @@ class AlleventsInScraper(BaseEngine):
                 "latitude": float(venue.get("latitude")) if venue.get("latitude") else None,
                 "longitude": float(venue.get("longitude")) if venue.get("longitude") else None,
                 "link": event.get("event_url"),
+                "external_id": event.get("event_url"),
                 "categories": event.get("categories"),
                 "image": event.get("thumb_url"),
             }
@@ -672,79 +584,73 @@ class AlleventsInScraper(BaseEngine):
     def save_city(self, city_name, state_code, latitude, longitude):
         if not city_name or not state_code:
             return None
-        city_obj, created = City.objects.get_or_create(
-            city_ascii=city_name,
-            region__state_code__iexact=state_code,
+        region = self.geo.get_region(state_code=state_code)
+        if not region:
+            logger.warning(
+                f"Location with state_code '{state_code}' not found for city {city_name}")
+            return None
+        city_obj = self.geo.get_city(
+            region,
+            city_name,
             defaults={
                 "city_name": city_name,
                 "lat": latitude or 0.0,
                 "lng": longitude or 0.0,
                 "coords": Point(longitude or 0.0, latitude or 0.0),
+                "timezone": region.timezone,
             },
         )
-        # Attempt to link the region (state)
-        if created or not city_obj.region:
-            from event.models import Location  # Import here to avoid circular
-            try:
-                region = Location.objects.get(state_code__iexact=state_code)
-                city_obj.region = region
-                city_obj.save()
-            except Location.DoesNotExist:
-                logger.warning(
-                    f"Location with state_code '{state_code}' not found for city {city_name}")
         return city_obj
 
-    def save_event(self, event_data):
-        city = self.save_city(
-            event_data.get("city_name"),
-            event_data.get("state_code"),
-            event_data.get("latitude"),
-            event_data.get("longitude"),
-        )
-        if not city:
-            logger.warning(
-                f"Skipping event '{event_data.get('title')}' due to missing city/region.")
-            return None, False
-
-        event, created = Event.objects.get_or_create(
-            title=event_data["title"],
-            start_date=event_data["start_date"],
-            # when=event_data.get("when"),
-            city=city,
-            defaults={
-                "description": event_data.get("description", ""),
-                "venue": event_data.get("venue"),
-                "link": event_data.get("link"),
-                "event_source": "all_events_in",
-                "valid": True,
-            },
-        )
-        event_image = None
-        if created and event_data.get("image"):
-            event_image = self.download_image(
-                event_data.get("image"), event_data["title"])
-        if event_image:
-            event.event_image = event_image
-            event.save()
-            logger.info(f"Image linked to event: {event.title}")
-        logger.info(
-            f"Event {'created' if created else 'updated'}: {event.title}")
-        return event, created
-
-    def process(self, search_phrase: SearchPhrase):
-        search_query = self.construct_query(search_phrase)
-        for city in search_query.cities:
-            search_url = f"{self.BASE_URL}/{city.get_all_event_in_slug}/{search_query.search}/"
-            logger.info(f"Processing allevents.in URL: {search_url}")
-            if not self.fetch_html(search_url):
+    def save_event(self, events):
+        rows = []
+        for event_data in events:
+            city = self.save_city(
+                event_data.get("city_name"),
+                event_data.get("state_code"),
+                event_data.get("latitude"),
+                event_data.get("longitude"),
+            )
+            if not city:
+                logger.warning(
+                    f"Skipping event '{event_data.get('title')}' due to missing city/region.")
                 continue
+            rows.append((event_data, city))
+        return self.save_events(rows, "all_events_in")
 
-            if not self.extract_events_data():
-                continue
+    def replay_response(self, url, body):
+        events_data = self.extract_events_data(body)
+        if not events_data:
+            return None
+        return self.save_event(self.transform_events(events_data))
+
+    def plan_key(self, city, query):
+        if not city.city_ascii:
+            return None
+        return (slugify(query), city.get_all_event_in_slug)
+
+    def fetch_item(self, item: WorkItem):
+        if not item.city.city_ascii:
+            return None
+        search = slugify(self.item_query(item))
+        search_url = f"{self.BASE_URL}/{item.city.get_all_event_in_slug}/{search}/"
+        logger.info(f"Processing allevents.in URL: {search_url}")
+        events_data, _ = self.harvest_pages(
+            lambda page: self.fetch_listing_page(search_url, page),
+            key=lambda event: event.get("event_url"))
+        # Listings shift while they are walked, so an event can show up twice
+        return list({event.get("event_url"): event for event in events_data}.values())
+
+    def fetch_listing_page(self, search_url, page):
+        # allevents.in does not expose a page count
+        url = search_url if page == 1 else f"{search_url}?page={page}"
+        return self.extract_events_data(self.fetch_html(url)), None
 
-            events = self.transform_events()
-            for event_data in events:
-                self.save_event(event_data)
+    def parse_item(self, item: WorkItem, events_data):
+        return self.transform_events(events_data)
+
+    def persist_item(self, item: WorkItem, events):
+        return self.save_event(events)
 
 
 class ArtIdeaScraper(BaseEngine):
@@ -753,17 +659,11 @@ class ArtIdeaScraper(BaseEngine):
     EVENT_BASE_URL = "https://www.artidea.org"
     CITY_NAME = "New Haven"
     STATE_CODE = "CT"
-
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": random.choice(user_agents)
-        })
+    EVENT_SOURCE = "artidea"
 
     def fetch_html(self, url):
         logger.info(f"Fetching URL: {url}")
         try:
-            time.sleep(3)
             response = self.session.get(url, timeout=60)
             response.raise_for_status()
             return response.text
@@ -789,7 +689,9 @@ class ArtIdeaScraper(BaseEngine):
         html = self.fetch_html(url)
         if not html:
             return None
+        return self.parse_event_html(html, url, city)
 
+    def parse_event_html(self, html, url, city):
         soup = BeautifulSoup(html, "html.parser")
 
         title = soup.find("h1")
@@ -839,6 +741,7 @@ class ArtIdeaScraper(BaseEngine):
             # "when": when,
             "venue": venue,
             "link": url,
+            "external_id": url,
             "image": image_url,
         }
 
@@ -869,28 +772,180 @@ class ArtIdeaScraper(BaseEngine):
 
         links = self.get_event_links()
         logger.info(f"Found {len(links)} ArtIdea events.")
-        for link in links:
-            logger.info(f"Processing event URL: {link}")
-            event_data = self.parse_event_page(link, city)
-            if event_data:
-                self.save_event([event_data], city, event_source="artidea")
+        self.run_work_items(
+            WorkItem(None, city.region, city, url=link) for link in links)
+
+    def replay_response(self, url, body):
+        if "/event/" not in urlparse(url).path:
+            return None
+        city = self.replay_city
+        event_data = self.parse_event_html(body, url, city) if city else None
+        if event_data:
+            return self.save_event([event_data], city, event_source="artidea")
+
+    @cached_property
+    def replay_city(self):
+        return self.get_city()
+
+    def fetch_item(self, item: WorkItem):
+        return self.fetch_html(item.url)
+
+    def parse_item(self, item: WorkItem, html):
+        event_data = self.parse_event_html(html, item.url, item.city)
+        return [event_data] if event_data else None
+
+    def persist_item(self, item: WorkItem, events):
+        return self.save_event(events, item.city, event_source="artidea")
+
+
+class TicketmasterEngine(BaseEngine):
+    """
+    Ticketmaster Discovery API. Every call returns up to
+    TICKET_MASTER_PAGE_SIZE events, searched around a city's coordinates
+    (or across its state when it has none). The pages of a search are
+    fetched concurrently and persisted in one bulk upsert.
+    """
+    EVENT_SOURCE = "ticketmaster"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.BASE_URL = app_settings.TICKET_MASTER_API_ENDPOINT
+        self.API_KEY = app_settings.TICKET_MASTER_API_KEY
+        self.page_size = app_settings.TICKET_MASTER_PAGE_SIZE
+
+    def plan_key(self, city, query):
+        return (normalize_query(query), city.pk)
+
+    def build_params(self, item: WorkItem):
+        params = {
+            "apikey": self.API_KEY,
+            "keyword": self.item_query(item),
+            "size": self.page_size,
+            "sort": "date,asc",
+        }
+        city = item.city
+        if city.lat and city.lng:
+            params.update(
+                geoPoint=geohash(float(city.lat), float(city.lng)),
+                radius=app_settings.TICKET_MASTER_RADIUS_MILES,
+                unit="miles")
+        else:
+            params.update(
+                stateCode=city.region.state_code,
+                countryCode=city.region.country.iso2_code)
+        return params
+
+    def fetch_page(self, params, page):
+        # Discovery pages are 0-based and may not go past the 1000th event
+        if page * self.page_size > 1000:
+            return None, None
+        try:
+            response = self.session.get(
+                self.BASE_URL, params={**params, "page": page - 1}, timeout=60)
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Error fetching Ticketmaster page {page}: {e}")
+            return None, None
+        events = data.get("_embedded", {}).get("events", [])
+        return events, data.get("page", {}).get("totalPages")
+
+    def fetch_item(self, item: WorkItem):
+        params = self.build_params(item)
+        logger.info(f"Processing Ticketmaster search: {params['keyword']} near {item.city}")
+        events, _ = PageHarvester(
+            lambda page: self.fetch_page(params, page),
+            max_pages=self.max_pages,
+            workers=app_settings.CRAWL_PAGE_WORKERS,
+            name="ticketmaster-pages",
+        ).run()
+        return events
+
+    def parse_start(self, dates):
+        start = dates.get("start", {})
+        if start.get("dateTime"):
+            return datetime.strptime(
+                start["dateTime"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=pytz.UTC)
+        if start.get("localDate"):
+            start_date = datetime.strptime(start["localDate"], "%Y-%m-%d")
+            try:
+                return pytz.timezone(dates.get("timezone") or "UTC").localize(start_date)
+            except pytz.UnknownTimeZoneError:
+                return pytz.utc.localize(start_date)
+        return None
+
+    def parse_data(self, events_list: list):
+        events = []
+        for event in events_list:
+            venues = event.get("_embedded", {}).get("venues") or [{}]
+            venue = venues[0]
+            address = ", ".join(part for part in (
+                venue.get("name"),
+                venue.get("address", {}).get("line1"),
+                venue.get("city", {}).get("name"),
+                venue.get("state", {}).get("stateCode"),
+            ) if part)
+            images = event.get("images") or []
+            image = max(images, key=lambda image: image.get("width") or 0) if images else {}
+            events.append({
+                "title": event.get("name"),
+                "start_date": self.parse_start(event.get("dates", {})),
+                "description": event.get("info") or event.get("pleaseNote") or "",
+                "venue": address,
+                "link": event.get("url"),
+                "external_id": event.get("id"),
+                "image": image.get("url"),
+                "venue_raw": venue,
+            })
+        return events
+
+    def parse_item(self, item: WorkItem, events_list):
+        return self.parse_data(events_list)
+
+    def replay_response(self, url, body):
+        events = json.loads(body).get("_embedded", {}).get("events", [])
+        return self.persist_item(None, self.parse_data(events)) if events else None
+
+    def persist_item(self, item: WorkItem, events):
+        rows = []
+        for event_data in events:
+            venue = event_data.pop("venue_raw", None) or {}
+            location = venue.get("location", {})
+            _, _, city = self.resolve_location({
+                "city": venue.get("city", {}).get("name"),
+                "region": venue.get("state", {}).get("stateCode") or "",
+                "country": venue.get("country", {}).get("countryCode") or "",
+                "postal_code": venue.get("postalCode"),
+                "latitude": location.get("latitude", "0.0"),
+                "longitude": location.get("longitude", "0.0"),
+            })
+            # Events in the radius belong to their venue's city; fall back
+            # to the searched city when the venue has no usable address.
+            city = city or (item.city if item else None)
+            if not city:
+                logger.warning(
+                    f"Skipping event due to unresolved location: {event_data.get('title')}")
+                continue
+            rows.append((event_data, city))
+        return self.save_events(rows, self.EVENT_SOURCE)
 
 
 class SearchEngine:
-    def __init__(self, engine='serp_api_google_event'):
-        if engine == 'serp_api_google_event':
-            self.engine = SerpAPIGoogleEngine()
-        elif engine == 'eventbrite':
-            self.engine = EventbriteWebScraperPlusAPI()
-        elif engine == 'all_events':
-            self.engine = AlleventsInScraper()
-        elif engine == 'artidea':
-            self.engine = ArtIdeaScraper()
-        else:
-            self.engine = None
+    ENGINES = {
+        'serp_api_google_event': SerpAPIGoogleEngine,
+        'eventbrite': EventbriteWebScraperPlusAPI,
+        'all_events': AlleventsInScraper,
+        'artidea': ArtIdeaScraper,
+        'ticketmaster': TicketmasterEngine,
+    }
+
+    def __init__(self, engine='serp_api_google_event', **options):
+        engine_class = self.ENGINES.get(engine)
+        self.engine = engine_class(**options) if engine_class else None
 
     def perform_search(self):
         if self.engine:
             self.engine.fetch_events()
+            return self.engine.checkpoint.summary()
         else:
             logger.error("Invalid search engine specified")
@@ -0,0 +1,86 @@
+import queue
+import logging
+import threading
+from collections import namedtuple
+
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+# One unit of crawl work: a search phrase queried against a single city, or
+# a single page (`url`) for sources that are crawled link by link. `query`
+# overrides the phrase text when the planner merged several phrases.
+WorkItem = namedtuple(
+    "WorkItem", ["search_phrase", "location", "city", "url", "query"],
+    defaults=[None, None])
+
+_STOP = object()
+
+
+class CrawlExecutor:
+    """
+    Runs a handler over a list of work items on a pool of worker threads.
+
+    Each worker owns its own database connection, which is closed when the
+    worker exits. With `concurrency=1` items are handled inline, in order,
+    which keeps the sequential behaviour the cron jobs have always had.
+    """
+
+    def __init__(self, concurrency=1, name="crawl"):
+        self.concurrency = max(1, int(concurrency))
+        self.name = name
+        self.processed = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def _handle(self, handler, item):
+        try:
+            handler(item)
+            ok = True
+        except Exception as e:
+            logger.exception(f"[{self.name}] Work item {item} failed: {e}")
+            ok = False
+        with self._lock:
+            if ok:
+                self.processed += 1
+            else:
+                self.failed += 1
+
+    def _worker(self, handler, work_queue):
+        try:
+            while True:
+                item = work_queue.get()
+                try:
+                    if item is _STOP:
+                        return
+                    self._handle(handler, item)
+                finally:
+                    work_queue.task_done()
+        finally:
+            connection.close()
+
+    def run(self, items, handler):
+        if self.concurrency == 1:
+            for item in items:
+                self._handle(handler, item)
+            return self.processed, self.failed
+
+        work_queue = queue.Queue(maxsize=self.concurrency * 2)
+        workers = [
+            threading.Thread(
+                target=self._worker, args=(handler, work_queue),
+                name=f"{self.name}-{i}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for worker in workers:
+            worker.start()
+        for item in items:
+            work_queue.put(item)
+        for _ in workers:
+            work_queue.put(_STOP)
+        for worker in workers:
+            worker.join()
+
+        logger.info(
+            f"[{self.name}] Finished {self.processed} work items ({self.failed} failed)")
+        return self.processed, self.failed
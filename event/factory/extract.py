@@ -0,0 +1,62 @@
+import re
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_MODES = ("fast", "soup")
+
+_decoder = json.JSONDecoder()
+_ASSIGNMENT = re.compile(r"\s*=\s*")
+# A bare JavaScript `undefined` in value position: after `:`, `[` or `,`
+# and before `,`, `]` or `}`. String literals are matched as a whole first,
+# so text inside them is never patched.
+_UNDEFINED = re.compile(r'"(?:[^"\\]|\\.)*"|(?<=[:\[,])(\s*)undefined(?=\s*[,\]}])')
+
+
+def _patch_undefined(match):
+    if match.group(0).startswith('"'):
+        return match.group(0)
+    return match.group(1) + "null"
+
+
+def extract_assigned_json(text, marker, expected_type=None):
+    """
+    Decode the JSON value assigned to `marker` (e.g. `window.__SERVER_DATA__`)
+    straight from the page text, without building a DOM.
+
+    The value is decoded in place from the offset after `marker =`, so the
+    cost is the size of the value, not of the document. JavaScript
+    `undefined` literals are read as null; string contents are left alone. Returns None when the marker is
+    missing or the value is not valid JSON, so callers can fall back to a
+    full parse.
+    """
+    if not text:
+        return None
+    index = text.find(marker)
+    while index != -1:
+        assignment = _ASSIGNMENT.match(text, index + len(marker))
+        if assignment:
+            value = _decode_at(text, assignment.end())
+            if value is not None and (expected_type is None or isinstance(value, expected_type)):
+                return value
+        index = text.find(marker, index + len(marker))
+    return None
+
+
+def _decode_at(text, start):
+    try:
+        return _decoder.raw_decode(text, start)[0]
+    except json.JSONDecodeError as e:
+        if not text.startswith("undefined", e.pos):
+            logger.debug(f"Fast JSON extraction failed at offset {e.pos}: {e.msg}")
+            return None
+    # Patch only the rest of the <script> block that holds the value;
+    # script content cannot contain "</script".
+    end = text.find("</script", start)
+    segment = text[start:end] if end != -1 else text[start:]
+    try:
+        return _decoder.raw_decode(_UNDEFINED.sub(_patch_undefined, segment))[0]
+    except json.JSONDecodeError as e:
+        logger.debug(f"Fast JSON extraction failed at offset {start + e.pos}: {e.msg}")
+        return None
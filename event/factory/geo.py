@@ -0,0 +1,205 @@
+import logging
+import threading
+
+from event.models import Country, Location, City, ZipCode
+
+logger = logging.getLogger(__name__)
+
+ZIP_FLUSH_SIZE = 500
+
+
+def normalize(value):
+    return " ".join(str(value).split()).casefold() if value else ""
+
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash(lat, lng, precision=9):
+    """Encode a point as a geohash, the format of Ticketmaster's `geoPoint`."""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    bits, even = [], True
+    while len(bits) < precision * 5:
+        value, bounds = (lng, lng_range) if even else (lat, lat_range)
+        middle = (bounds[0] + bounds[1]) / 2
+        if value >= middle:
+            bits.append(1)
+            bounds[0] = middle
+        else:
+            bits.append(0)
+            bounds[1] = middle
+        even = not even
+    return "".join(
+        _GEOHASH_BASE32[int("".join(map(str, bits[i:i + 5])), 2)]
+        for i in range(0, len(bits), 5))
+
+
+class GeoResolver:
+    """
+    Crawl-scoped resolver for countries, states, cities and zip codes.
+
+    With `preload=True` every place is bulk-loaded once and scraped
+    addresses are resolved in memory; otherwise places are looked up on
+    first use and cached. A miss always falls back to the database, so
+    places added by a concurrent crawler are picked up, and only then is a
+    new row created from `defaults`. New zip codes and city/zip links are
+    queued and written in batches by `flush()`.
+    """
+
+    def __init__(self, preload=True):
+        self.preload = preload
+        self._loaded = False
+        self._lock = threading.RLock()
+        self.countries = {}
+        self.regions = {}
+        self.regions_by_name = {}
+        self.cities = {}
+        self.zip_codes = {}
+        self.city_zip_links = set()
+        self._pending_zips = {}
+        self._pending_links = set()
+
+    # Cache ------------------------------------------------------------------
+
+    def _cache_country(self, country):
+        self.countries[country.iso2_code.upper()] = country
+        self.countries.setdefault(normalize(country.country_name), country)
+        return country
+
+    def _cache_region(self, region):
+        code = region.state_code.upper()
+        self.regions[(region.country_id, code)] = region
+        self.regions.setdefault((None, code), region)
+        self.regions_by_name[(region.country_id, normalize(region.state_name))] = region
+        return region
+
+    def _cache_city(self, city, state_code):
+        state_code = state_code.upper()
+        self.cities[(normalize(city.city_ascii), state_code)] = city
+        self.cities.setdefault((normalize(city.city_name), state_code), city)
+        return city
+
+    def load(self):
+        with self._lock:
+            if self._loaded or not self.preload:
+                return
+            for country in Country.objects.all():
+                self._cache_country(country)
+            for region in Location.objects.all():
+                self._cache_region(region)
+            for city in City.objects.select_related("region").only(
+                    "id", "city_ascii", "city_name", "timezone",
+                    "region__id", "region__state_code", "region__timezone"):
+                self._cache_city(city, city.region.state_code)
+            self.zip_codes = dict(
+                ZipCode.objects.values_list("zip_code", "id"))
+            self.city_zip_links = set(
+                City.area_code.through.objects.values_list("city_id", "zipcode_id"))
+            self._loaded = True
+            logger.info(
+                f"Geo resolver loaded {len(self.regions)} states, "
+                f"{len(self.cities)} city keys and {len(self.zip_codes)} zip codes")
+
+    # Lookups ----------------------------------------------------------------
+
+    def get_country(self, iso2=None, name=None, defaults=None):
+        key = iso2.upper() if iso2 else normalize(name)
+        if not key:
+            return None
+        with self._lock:
+            self.load()
+            if key in self.countries:
+                return self.countries[key]
+            lookup = {"iso2_code__iexact": iso2} if iso2 else {"country_name__iexact": name}
+            country = Country.objects.filter(**lookup).first()
+            if country is None and defaults is not None:
+                country, _ = Country.objects.get_or_create(**lookup, defaults=defaults)
+            if country is None:
+                return None
+            self.countries[key] = country
+            return self._cache_country(country)
+
+    def get_region(self, country=None, state_code=None, state_name=None, defaults=None):
+        country_id = country.pk if country else None
+        if state_code:
+            key, cache = (country_id, state_code.upper()), self.regions
+            lookup = {"state_code__iexact": state_code}
+        elif state_name:
+            key, cache = (country_id, normalize(state_name)), self.regions_by_name
+            lookup = {"state_name__iexact": state_name}
+        else:
+            return None
+        with self._lock:
+            self.load()
+            if key in cache:
+                return cache[key]
+            if country is not None:
+                lookup["country"] = country
+            region = Location.objects.filter(**lookup).first()
+            if region is None and defaults is not None and country is not None:
+                region, _ = Location.objects.get_or_create(**lookup, defaults=defaults)
+            if region is None:
+                return None
+            cache[key] = region
+            return self._cache_region(region)
+
+    def get_city(self, region, city_name, defaults=None):
+        if not (region and city_name):
+            return None
+        key = (normalize(city_name), region.state_code.upper())
+        with self._lock:
+            self.load()
+            if key in self.cities:
+                return self.cities[key]
+            city = (
+                City.objects.filter(region=region, city_ascii__iexact=city_name).first()
+                or City.objects.filter(region=region, city_name__iexact=city_name).first()
+            )
+            if city is None and defaults is not None:
+                city, _ = City.objects.get_or_create(
+                    region=region, city_ascii__iexact=city_name,
+                    defaults={"city_ascii": city_name, **defaults})
+            if city is None:
+                return None
+            self.cities[key] = city
+            return self._cache_city(city, region.state_code)
+
+    def add_zip_code(self, city, region, zip_code):
+        zip_code = str(zip_code).strip()
+        if not (city and zip_code):
+            return
+        with self._lock:
+            self.load()
+            zip_id = self.zip_codes.get(zip_code)
+            if zip_id is not None and (city.pk, zip_id) in self.city_zip_links:
+                return
+            if zip_id is None:
+                self._pending_zips.setdefault(zip_code, (city.pk, region.pk))
+            self._pending_links.add((city.pk, zip_code))
+            if len(self._pending_links) >= ZIP_FLUSH_SIZE:
+                self.flush()
+
+    def flush(self):
+        """Write queued zip codes and city/zip links in two bulk statements."""
+        with self._lock:
+            if self._pending_zips:
+                ZipCode.objects.bulk_create([
+                    ZipCode(zip_code=code, city_id=city_id, state_id=region_id)
+                    for code, (city_id, region_id) in self._pending_zips.items()
+                ], ignore_conflicts=True)
+                self.zip_codes.update(ZipCode.objects.filter(
+                    zip_code__in=self._pending_zips).values_list("zip_code", "id"))
+                self._pending_zips = {}
+
+            links = {
+                (city_id, self.zip_codes[code])
+                for city_id, code in self._pending_links if code in self.zip_codes
+            } - self.city_zip_links
+            if links:
+                Through = City.area_code.through
+                Through.objects.bulk_create([
+                    Through(city_id=city_id, zipcode_id=zip_id)
+                    for city_id, zip_id in links
+                ], ignore_conflicts=True)
+                self.city_zip_links |= links
+            self._pending_links = set()
@@ -0,0 +1,127 @@
+import random
+import logging
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from event.factory.user_agents import user_agents
+from event.app_settings import app_settings
+from event.factory.rate_limit import get_rate_limiter, parse_retry_after
+from event.factory.cache import get_response_cache
+from event.factory.metrics import record, record_error
+
+logger = logging.getLogger(__name__)
+
+
+class HostLimiter:
+    """Caps the number of in-flight requests per host."""
+
+    def __init__(self, limit):
+        self.limit = max(1, int(limit))
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def get_semaphore(self, host):
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.limit)
+            return self._semaphores[host]
+
+
+class CrawlSession(requests.Session):
+    """
+    Session shared by the worker threads of an engine. Every request goes
+    through the per-host limiter so a large worker pool never opens more
+    than `per_host_concurrency` connections to a single source, and takes
+    a token from the host's shared rate budget before it is sent. 429s
+    (and 503s carrying `Retry-After`) pause the host's bucket and are
+    retried up to `max_retries` times.
+
+    GET requests are served from, and written to, the on-disk response
+    cache when one is configured. Every GET response served, fetched or
+    cached, is also appended to `archive` (a `ResponseArchive`) when one
+    is given.
+    """
+
+    def __init__(self, per_host_concurrency=None, pool_size=None, headers=None,
+                 rate_limiter=None, max_retries=None, offline=False, archive=None):
+        super().__init__()
+        self.cache = get_response_cache(offline=offline)
+        self.archive = archive
+        per_host_concurrency = per_host_concurrency or app_settings.CRAWL_PER_HOST_CONCURRENCY
+        self.host_limiter = HostLimiter(per_host_concurrency)
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.max_retries = app_settings.CRAWL_MAX_RETRIES if max_retries is None else max_retries
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=max(pool_size or 0, self.host_limiter.limit, 10))
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+        self.headers.update({"User-Agent": random.choice(user_agents)})
+        if headers:
+            self.headers.update(headers)
+
+    @staticmethod
+    def is_throttled(response):
+        return response.status_code == 429 or (
+            response.status_code == 503 and "Retry-After" in response.headers)
+
+    def request(self, method, url, *args, **kwargs):
+        response = self.fetch(method, url, *args, **kwargs)
+        # What was served, from the network or the cache, so a replay
+        # sees every page the crawl parsed.
+        if self.archive is not None and method.upper() == "GET":
+            self.archive.write(response)
+        return response
+
+    def fetch(self, method, url, *args, **kwargs):
+        if self.cache is None or method.upper() != "GET":
+            return self.send_throttled(method, url, *args, **kwargs)
+
+        key = self.cache.make_key(method, url, kwargs.get("params"))
+        entry = self.cache.get(key)
+        if entry is not None:
+            if self.cache.offline or entry.is_fresh(self.cache.ttl):
+                record("cache_hits")
+                return entry.to_response()
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **entry.validators()}
+        elif self.cache.offline:
+            raise requests.ConnectionError(
+                f"{url} is not in the response cache (offline mode)")
+
+        response = self.send_throttled(method, url, *args, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            record("cache_hits")
+            return self.cache.refresh(key, entry, response).to_response(response.request)
+        self.cache.set(key, response)
+        return response
+
+    def send_throttled(self, method, url, *args, **kwargs):
+        host = urlparse(url).netloc
+        bucket = self.rate_limiter.get_bucket(host)
+        for attempt in range(self.max_retries + 1):
+            bucket.acquire()
+            with self.host_limiter.get_semaphore(host):
+                try:
+                    response = super().request(method, url, *args, **kwargs)
+                except requests.RequestException as e:
+                    record("http_requests")
+                    record_error(type(e).__name__)
+                    raise
+            record("http_requests")
+            record("http_bytes", len(response.content))
+            if response.status_code >= 400:
+                record_error(f"HTTP {response.status_code}")
+            if not self.is_throttled(response):
+                bucket.recover()
+                return response
+            delay = bucket.backoff(
+                parse_retry_after(response.headers.get("Retry-After")))
+            logger.warning(
+                f"{host} responded {response.status_code}, backing off {delay:.1f}s "
+                f"(attempt {attempt + 1}/{self.max_retries + 1})")
+            if attempt < self.max_retries:
+                response.close()
+        return response
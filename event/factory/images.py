@@ -0,0 +1,190 @@
+import queue
+import hashlib
+import logging
+import threading
+from io import BytesIO
+from collections import Counter
+
+import requests
+from PIL import Image
+from django.db import connection
+from django.db.models import Q
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from event.models import Event
+from event.app_settings import app_settings
+from event.factory.executor import CrawlExecutor
+from event.factory.metrics import current_metrics
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def image_url_hash(image_url):
+    return hashlib.sha1(image_url.encode()).hexdigest()
+
+
+def image_storage_name(image_url):
+    return f"event/{image_url_hash(image_url)}.jpg"
+
+
+IMAGE_FORMATS = (("webp", "WEBP"), ("jpeg", "JPEG"))
+IMAGE_EXTENSIONS = {"webp": "webp", "jpeg": "jpg"}
+
+
+def store_image_variants(name, img=None, rebuild=False):
+    """
+    Make sure the resized WebP/JPEG derivatives of a stored image exist and
+    return their storage names. Derivatives live under
+    `event/variants/<original storage name>/` and are only generated once,
+    unless `rebuild` is set.
+    """
+    sizes = {}
+    for label, width in app_settings.EVENT_IMAGE_VARIANTS.items():
+        sizes[label] = {"width": width}
+        for key, image_format in IMAGE_FORMATS:
+            # The full name, extension included, so `poster.jpg` and
+            # `poster.png` do not share derivatives.
+            variant_name = f"event/variants/{name}/{label}.{IMAGE_EXTENSIONS[key]}"
+            exists = default_storage.exists(variant_name)
+            if rebuild and exists:
+                default_storage.delete(variant_name)
+            if rebuild or not exists:
+                if img is None:
+                    with default_storage.open(name, "rb") as original:
+                        img = Image.open(original)
+                        img = img.convert("RGB")
+                resized = img.copy()
+                resized.thumbnail((width, width * 4), Image.LANCZOS)
+                img_io = BytesIO()
+                resized.save(
+                    img_io, format=image_format,
+                    quality=app_settings.EVENT_IMAGE_QUALITY)
+                variant_name = default_storage.save(
+                    variant_name, ContentFile(img_io.getvalue()))
+            sizes[label][key] = variant_name
+    return {"source": name, "sizes": sizes}
+
+
+def store_image(image_url, session=None):
+    """
+    Download an image, re-encode it as JPEG and store it under a name
+    derived from its source URL, along with its responsive variants. An
+    image that is already stored is not fetched again, so a poster shared
+    by many events exists once.
+    """
+    name = image_storage_name(image_url)
+    if default_storage.exists(name):
+        return name, store_image_variants(name)
+    response = (session or requests).get(image_url, timeout=30)
+    response.raise_for_status()
+    img = Image.open(BytesIO(response.content))
+    img = img.convert("RGB")
+    img_io = BytesIO()
+    img.save(img_io, format='JPEG')
+    name = default_storage.save(name, ContentFile(img_io.getvalue()))
+    logger.info(f"Image downloaded successfully: {name}")
+    return name, store_image_variants(name, img)
+
+
+def link_image(event_ids, name, variants):
+    """Point events that have no image yet at a stored image."""
+    return Event.objects.filter(
+        Q(event_image="") | Q(event_image__isnull=True), id__in=event_ids
+    ).update(event_image=name, event_image_variants=variants)
+
+
+class ImagePipeline:
+    """
+    Background image ingestion fed by (event_id, image_url) pairs.
+
+    Downloads run on a pool of `workers` threads so the crawl never waits
+    on image decoding. Requests for the same source URL are coalesced:
+    the image is fetched once and linked to every event that asked for it.
+    Downloads are counted in `downloaded_by` against the `CrawlMetrics`
+    of the work item that queued them.
+    """
+
+    def __init__(self, session=None, workers=None):
+        self.session = session
+        self.workers = workers or app_settings.CRAWL_IMAGE_WORKERS
+        self._lock = threading.Lock()
+        self._waiting = {}
+        self._owners = {}
+        self._stored = {}
+        self.downloaded_by = Counter()
+        self.downloaded = 0
+        self.failed = 0
+        self._queue = None
+        self._thread = None
+
+    def start(self):
+        # Bounded so a backlog of downloads slows the crawl down instead of
+        # piling up in memory.
+        self._queue = queue.Queue(maxsize=self.workers * 4)
+        self._thread = threading.Thread(
+            target=self._run, name="image-pipeline", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            CrawlExecutor(self.workers, name="images").run(
+                iter(self._queue.get, _STOP), self._handle)
+        finally:
+            connection.close()
+
+    def _handle(self, image_url):
+        key = image_url_hash(image_url)
+        try:
+            stored = store_image(image_url, self.session)
+        except Exception as e:
+            logger.error(f"Failed to download image {image_url}: {e}")
+            stored = None
+        with self._lock:
+            event_ids = self._waiting.pop(key, [])
+            owner = self._owners.pop(key, None)
+            if stored:
+                self._stored[key] = stored
+                self.downloaded += 1
+                if owner is not None:
+                    self.downloaded_by[owner] += 1
+            else:
+                self.failed += 1
+        if stored and event_ids:
+            linked = link_image(event_ids, *stored)
+            logger.info(f"Image {stored[0]} linked to {linked} events")
+
+    def submit(self, event_id, image_url):
+        if not image_url:
+            return
+        key = image_url_hash(image_url)
+        with self._lock:
+            stored = self._stored.get(key)
+            if stored is None:
+                if key in self._waiting:
+                    self._waiting[key].append(event_id)
+                    return
+                self._waiting[key] = [event_id]
+                self._owners[key] = current_metrics()
+                if self._thread is None:
+                    self.start()
+                work_queue = self._queue
+        if stored is None:
+            # Outside the lock: a full queue blocks the caller, and workers
+            # need the lock to finish the downloads that drain it.
+            work_queue.put(image_url)
+            return
+        link_image([event_id], *stored)
+
+    def close(self):
+        """Wait for queued images to finish and stop the workers."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            work_queue = self._queue
+        if thread is None:
+            return
+        # Outside the lock, like `submit`: the queue may be full.
+        work_queue.put(_STOP)
+        thread.join()
@@ -0,0 +1,82 @@
+import time
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+from django.db import connection
+
+_local = threading.local()
+
+
+class CrawlMetrics:
+    """
+    Counters and timings for one work item, or a whole run once merged.
+
+    Stages attach the item's metrics to their thread with `collect()`, so
+    HTTP requests made by the session and queries run on the thread's
+    database connection are attributed to the item being handled.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.counters = Counter()
+        self.errors = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+
+    def error(self, name, count=1):
+        with self._lock:
+            self.errors[name] += count
+
+    def merge(self, other):
+        with self._lock:
+            self.counters.update(other.counters)
+            self.errors.update(other.errors)
+
+    @property
+    def wall_seconds(self):
+        return time.perf_counter() - self.started
+
+
+def current_metrics():
+    return getattr(_local, "metrics", None)
+
+
+def record(name, value=1):
+    """Add to a counter of the work item handled by this thread, if any."""
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.add(name, value)
+
+
+def record_error(name):
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.error(name)
+
+
+def _count_queries(execute, sql, params, many, context):
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        record("db_queries")
+        record("db_seconds", time.perf_counter() - started)
+
+
+@contextmanager
+def collect(metrics, stage=None):
+    """Attribute HTTP, DB and timing counters on this thread to `metrics`."""
+    previous = current_metrics()
+    _local.metrics = metrics
+    started = time.perf_counter()
+    try:
+        with connection.execute_wrapper(_count_queries):
+            yield metrics
+    finally:
+        if stage:
+            metrics.add(f"{stage}_seconds", time.perf_counter() - started)
+        _local.metrics = previous
@@ -0,0 +1,73 @@
+import logging
+import threading
+from contextlib import nullcontext
+
+from event.factory.executor import CrawlExecutor
+from event.factory.metrics import collect, current_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class PageHarvester:
+    """
+    Walks the result pages of one listing (`?page=N`) up to `max_pages`.
+
+    `fetch_page(page)` returns `(entries, page_count)`, with `page_count`
+    None when the source does not say how many pages there are.
+    `known_keys(entries)` returns the keys of the entries that are already
+    stored, and `key(entry)` the key of one entry. Without `known_keys`
+    every page up to the depth is walked.
+
+    The first page is fetched alone. Later pages are fetched `workers` at
+    a time, and the walk stops after an empty page or a page holding only
+    known events, so a listing that has not changed costs one request
+    whatever the depth.
+    """
+
+    def __init__(self, fetch_page, known_keys=None, key=None, max_pages=1, workers=1, name="pages"):
+        self.fetch_page = fetch_page
+        self.known_keys = known_keys
+        self.key = key
+        self.max_pages = max(1, max_pages)
+        self.workers = max(1, workers)
+        self.name = name
+
+    def fetch_wave(self, pages):
+        metrics = current_metrics()
+        results = {}
+        lock = threading.Lock()
+
+        def fetch(page):
+            # Count the requests against the work item, not the page thread
+            with collect(metrics) if metrics else nullcontext():
+                result = self.fetch_page(page)
+            with lock:
+                results[page] = result
+
+        CrawlExecutor(len(pages), name=self.name).run(pages, fetch)
+        return [results.get(page) for page in pages]
+
+    def run(self):
+        """Return `(entries, known)`: the entries of every page walked and the known keys among them."""
+        entries, known = [], set()
+        last_page = self.max_pages
+        page = 1
+        while page <= last_page:
+            pages = [page] if page == 1 else list(
+                range(page, min(page + self.workers, last_page + 1)))
+            for number, result in zip(pages, self.fetch_wave(pages)):
+                page_entries, page_count = result or (None, None)
+                if not page_entries:
+                    return entries, known
+                if page_count:
+                    last_page = min(last_page, page_count)
+                entries.extend(page_entries)
+                if self.known_keys is None:
+                    continue
+                page_known = self.known_keys(page_entries)
+                known.update(page_known)
+                if all(self.key(entry) in page_known for entry in page_entries):
+                    logger.info(f"[{self.name}] Page {number} holds only known events, stopping")
+                    return entries, known
+            page += len(pages)
+        return entries, known
@@ -0,0 +1,162 @@
+import hashlib
+import logging
+from collections import namedtuple
+
+from event.models import Event
+from event.search import refresh_search_documents
+
+logger = logging.getLogger(__name__)
+
+UpsertResult = namedtuple("UpsertResult", ["created", "updated", "skipped"])
+
+# Identity of a scraped event; backed by a unique constraint on Event.
+EVENT_IDENTITY_FIELDS = ["event_source", "external_id"]
+# Columns refreshed from the source when an event is seen again. Moderation
+# flags (`valid`, `featured`) are left untouched.
+EVENT_UPDATE_FIELDS = ["title", "start_date", "description", "venue", "link"]
+
+
+def event_key(event):
+    return (event.event_source, event.external_id)
+
+
+def natural_key(event):
+    return (event.title, event.start_date, event.city_id)
+
+
+def normalize_external_id(value):
+    value = str(value).strip() if value is not None else ""
+    max_length = Event._meta.get_field("external_id").max_length
+    if len(value) > max_length:
+        return hashlib.sha1(value.encode()).hexdigest()
+    return value or None
+
+
+def _clip(field_name, value):
+    if value is None:
+        return value
+    max_length = Event._meta.get_field(field_name).max_length
+    return value[:max_length] if len(value) > max_length else value
+
+
+def build_event(data, city, event_source):
+    """Turn a normalized event dict into an unsaved Event, or None if unusable."""
+    start_date = Event._meta.get_field("start_date").to_python(
+        data.get("start_date"))
+    if not (data.get("title") and start_date and city):
+        logger.warning(
+            f"Skipping event '{data.get('title')}': missing title, start date or city.")
+        return None
+
+    link = data.get("link") or None
+    if link and len(link) > Event._meta.get_field("link").max_length:
+        link = None
+
+    event = Event(
+        title=_clip("title", data["title"].strip()),
+        start_date=start_date,
+        city=city,
+        description=data.get("description") or "",
+        venue=_clip("venue", data.get("venue") or ""),
+        link=link,
+        event_source=event_source,
+        valid=True,
+    )
+    # Sources without a stable ID fall back to a hash of the natural key.
+    event.external_id = normalize_external_id(data.get("external_id")) or (
+        "key:" + hashlib.sha1(
+            f"{event.title}|{event.start_date}|{city.pk}".encode()).hexdigest())
+    if data.get("when"):
+        event.when = _clip("when", data["when"])
+    return event
+
+
+def get_known_external_ids(event_source, external_ids):
+    """Return the subset of `external_ids` already stored for `event_source`."""
+    external_ids = {normalize_external_id(value) for value in external_ids}
+    return set(
+        Event.objects.filter(
+            event_source=event_source, external_id__in=external_ids
+        ).values_list("external_id", flat=True)
+    )
+
+
+def _match_legacy_rows(events):
+    """
+    Match events with an unseen source ID against rows that share their
+    (title, start_date, city). Rows from the same source without an ID are
+    claimed so the upsert updates them; rows from another source mean the
+    event is already listed, so the new copy is skipped.
+    """
+    if not events:
+        return [], []
+    matches = {}
+    for row in Event.objects.filter(
+        city_id__in={event.city_id for event in events},
+        start_date__in={event.start_date for event in events},
+        title__in={event.title for event in events},
+    ).values("id", "title", "start_date", "city_id", "event_source", "external_id"):
+        matches.setdefault(
+            (row["title"], row["start_date"], row["city_id"]), []).append(row)
+
+    claimed, skipped = [], []
+    for event in events:
+        rows = matches.get(natural_key(event), [])
+        legacy = next((
+            row for row in rows
+            if row["event_source"] == event.event_source and not row["external_id"]
+        ), None)
+        if legacy and Event.objects.filter(
+                id=legacy["id"], external_id__isnull=True).update(
+                external_id=event.external_id):
+            rows.remove(legacy)
+            claimed.append(event)
+        elif any(row["event_source"] != event.event_source for row in rows):
+            skipped.append(event)
+    return claimed, skipped
+
+
+def bulk_upsert_events(events):
+    """
+    Write a batch of unsaved events with a single INSERT ... ON CONFLICT
+    (event_source, external_id) DO UPDATE and report which rows were new.
+
+    Rows are de-duplicated on their identity and sorted before the write so
+    concurrent crawlers lock rows in the same order. The unique constraint
+    keeps the data correct if another crawler inserts the same event in
+    between; such a row is then reported as created by both.
+    """
+    batch = {}
+    for event in events:
+        batch[event_key(event)] = event
+    if not batch:
+        return UpsertResult([], [], [])
+    events = [batch[key] for key in sorted(batch)]
+
+    existing = set()
+    for event_source in {key[0] for key in batch}:
+        existing.update(
+            (event_source, external_id) for external_id in get_known_external_ids(
+                event_source, [key[1] for key in batch if key[0] == event_source]))
+
+    claimed, skipped = _match_legacy_rows(
+        [event for event in events if event_key(event) not in existing])
+    existing.update(event_key(event) for event in claimed)
+    skipped_keys = {event_key(event) for event in skipped}
+
+    saved = Event.objects.bulk_create(
+        [event for event in events if event_key(event) not in skipped_keys],
+        update_conflicts=True,
+        unique_fields=EVENT_IDENTITY_FIELDS,
+        update_fields=EVENT_UPDATE_FIELDS,
+    )
+    # bulk_create skips save(), so the search signals never see these rows
+    refresh_search_documents(event_ids=[event.pk for event in saved])
+
+    created, updated = [], []
+    for event in saved:
+        (updated if event_key(event) in existing else created).append(event)
+    logger.info(
+        f"Upserted {len(saved)} events ({len(created)} created, {len(updated)} updated, "
+        f"{len(skipped)} already listed by another source)")
+    return UpsertResult(created, updated, skipped)
@@ -0,0 +1,99 @@
+import queue
+import logging
+import threading
+from collections import namedtuple
+
+from django.db import connection
+
+from event.factory.executor import CrawlExecutor
+from event.factory.metrics import CrawlMetrics, collect
+
+logger = logging.getLogger(__name__)
+
+# A pipeline step. The first stage is called as `handler(item)`, later ones
+# as `handler(item, value)` with whatever the previous stage returned.
+Stage = namedtuple("Stage", ["name", "handler", "workers"])
+
+_STOP = object()
+
+
+class CrawlPipeline:
+    """
+    Streams work items through a chain of stages, each running on its own
+    `CrawlExecutor`, connected by bounded queues.
+
+    A stage that falls behind fills its input queue, which blocks the stage
+    before it, so a slow database or parser throttles fetching instead of
+    buffering pages in memory. Falsy stage results are dropped.
+
+    Every item carries a `CrawlMetrics` through the stages, collecting
+    per-stage time, HTTP and DB counters. `on_done(item, result, error,
+    metrics)` is called once per item when it leaves the pipeline, with
+    the last stage's result, with None when a stage dropped it, or with
+    the exception a stage raised.
+    """
+
+    def __init__(self, stages, queue_size=8, name="crawl", on_done=None):
+        self.stages = stages
+        self.queue_size = queue_size
+        self.name = name
+        self.on_done = on_done
+        self.stats = {}
+
+    def _done(self, item, result=None, error=None, metrics=None):
+        if self.on_done is None:
+            return
+        try:
+            self.on_done(item, result, error, metrics)
+        except Exception as e:
+            logger.exception(f"[{self.name}] Completion hook failed for {item}: {e}")
+
+    def _stage_handler(self, stage, index, output):
+        def handle(packet):
+            item, value, metrics = packet
+            try:
+                with collect(metrics, stage.name):
+                    result = stage.handler(item) if index == 0 else stage.handler(item, value)
+            except Exception as e:
+                metrics.error(type(e).__name__)
+                self._done(item, error=e, metrics=metrics)
+                raise
+            if result and output is not None:
+                output.put((item, result, metrics))
+            else:
+                self._done(item, result if output is None else None, metrics=metrics)
+        return handle
+
+    def _run_stage(self, stage, index, packets, output):
+        executor = CrawlExecutor(stage.workers, name=f"{self.name}-{stage.name}")
+        try:
+            self.stats[stage.name] = executor.run(
+                packets, self._stage_handler(stage, index, output))
+        finally:
+            if output is not None:
+                output.put(_STOP)
+            if index:
+                connection.close()
+
+    def run(self, items):
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages[1:]]
+        threads = []
+        for index, stage in enumerate(self.stages[1:], start=1):
+            output = queues[index] if index < len(queues) else None
+            thread = threading.Thread(
+                target=self._run_stage,
+                args=(stage, index, iter(queues[index - 1].get, _STOP), output),
+                name=f"{self.name}-{stage.name}", daemon=True)
+            thread.start()
+            threads.append(thread)
+
+        self._run_stage(
+            self.stages[0], 0, ((item, None, CrawlMetrics()) for item in items),
+            queues[0] if queues else None)
+        for thread in threads:
+            thread.join()
+
+        logger.info(f"[{self.name}] " + ", ".join(
+            f"{name}: {processed} ok / {failed} failed"
+            for name, (processed, failed) in self.stats.items()))
+        return self.stats
@@ -0,0 +1,103 @@
+import hashlib
+import logging
+from datetime import timedelta
+from collections import defaultdict
+
+from django.db.models import Count
+from django.utils import timezone
+
+from event.models import City, Event, SearchPhrase
+from event.app_settings import app_settings
+from event.factory.executor import WorkItem
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query):
+    return " ".join(query.split()).casefold()
+
+
+def city_shard(city_id, total):
+    """Deterministic 1-based shard of a city, the same on every machine."""
+    digest = hashlib.sha1(str(city_id).encode()).hexdigest()
+    return int(digest[:8], 16) % total + 1
+
+
+class CrawlPlanner:
+    """
+    Builds the full list of work items for an engine before the crawl
+    starts.
+
+    Active phrases are crossed with the cities of their locations, and
+    then:
+
+    - pairs that would send the same request to the source are collapsed,
+      using the engine's `plan_key`. This covers duplicate phrases and
+      cities that share a slug.
+    - phrases for the same city are merged into combined queries, up to
+      the engine's `MAX_PHRASES_PER_QUERY`.
+    - work is ordered by the number of events each city yielded for this
+      source recently.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def get_cities_by_region(self, phrases):
+        location_ids = {
+            location.pk for phrase in phrases for location in phrase.location.all()}
+        cities = defaultdict(list)
+        for city in City.objects.filter(
+                region_id__in=location_ids, active=True).select_related("region"):
+            cities[city.region_id].append(city)
+        return cities
+
+    def get_expected_yield(self, city_ids):
+        since = timezone.now() - timedelta(days=app_settings.CRAWL_PLAN_YIELD_DAYS)
+        return dict(
+            Event.objects.filter(
+                event_source=self.engine.EVENT_SOURCE,
+                city_id__in=city_ids,
+                timestamp__gte=since,
+            ).values_list("city_id").annotate(total=Count("id"))
+        )
+
+    def build(self, search_phrases=None):
+        if search_phrases is None:
+            search_phrases = SearchPhrase.objects.filter(active=True)
+        phrases = list(search_phrases.prefetch_related("location"))
+        cities_by_region = self.get_cities_by_region(phrases)
+
+        planned, pairs = {}, 0
+        for phrase in sorted(phrases, key=lambda phrase: phrase.pk):
+            for location in phrase.location.all():
+                for city in cities_by_region.get(location.pk, []):
+                    pairs += 1
+                    key = self.engine.plan_key(city, phrase.query)
+                    if key is not None:
+                        planned.setdefault(key, (city, location, phrase))
+
+        per_city = defaultdict(list)
+        for city, location, phrase in planned.values():
+            per_city[city.pk].append((city, location, phrase))
+
+        size = max(1, self.engine.MAX_PHRASES_PER_QUERY)
+        items = []
+        for entries in per_city.values():
+            entries.sort(key=lambda entry: normalize_query(entry[2].query))
+            for start in range(0, len(entries), size):
+                chunk = entries[start:start + size]
+                city, location, phrase = chunk[0]
+                query = None
+                if len(chunk) > 1:
+                    query = self.engine.combine_queries(
+                        [entry[2].query for entry in chunk])
+                items.append(WorkItem(phrase, location, city, query=query))
+
+        expected = self.get_expected_yield(per_city.keys())
+        items.sort(key=lambda item: (
+            -expected.get(item.city.pk, 0), item.city.pk, item.query or item.search_phrase.query))
+        logger.info(
+            f"Planned {len(items)} work items from {pairs} (phrase, city) pairs "
+            f"for {self.engine.EVENT_SOURCE}")
+        return items
@@ -0,0 +1,129 @@
+import time
+import logging
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from event.app_settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+BACKOFF_BASE = 2.0
+MAX_BACKOFF = 300.0
+
+
+def parse_retry_after(value):
+    """Return the number of seconds a `Retry-After` header asks us to wait."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. `rate` is in tokens per second and `burst`
+    is the bucket size; a `rate` of None means the host is unthrottled
+    until it pushes back with a 429.
+
+    Callers reserve a token and sleep outside the lock, so concurrent
+    workers queue up fairly behind a single shared budget.
+    """
+
+    def __init__(self, rate=None, burst=1):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        if self.rate:
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, self.blocked_until - now)
+            if self.rate:
+                self.tokens -= 1
+                if self.tokens < 0:
+                    wait = max(wait, -self.tokens / self.rate)
+            return wait
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def backoff(self, retry_after=None):
+        """Pause the bucket after a 429 and halve its rate."""
+        with self._lock:
+            self.failures += 1
+            if retry_after is None:
+                retry_after = min(
+                    MAX_BACKOFF, BACKOFF_BASE * 2 ** (self.failures - 1))
+            self.blocked_until = max(
+                self.blocked_until, time.monotonic() + retry_after)
+            if self.base_rate:
+                self.rate = max(self.base_rate / 16, self.rate / 2)
+            return retry_after
+
+    def recover(self):
+        """Creep back towards the configured rate after a successful call."""
+        with self._lock:
+            self.failures = 0
+            if self.base_rate and self.rate < self.base_rate:
+                self.rate = min(self.base_rate, self.rate * 1.25)
+
+
+class RateLimiter:
+    """
+    Registry of token buckets keyed by host. `share` scales every budget,
+    so processes crawling the same hosts in parallel split the politeness
+    budget instead of multiplying it.
+    """
+
+    def __init__(self, limits=None, share=1.0):
+        self.limits = limits if limits is not None else app_settings.CRAWL_RATE_LIMITS
+        self.share = share
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def get_bucket(self, host):
+        with self._lock:
+            if host not in self._buckets:
+                limit = self.limits.get(host, {})
+                rate = limit.get("rate")
+                self._buckets[host] = TokenBucket(
+                    rate=rate * self.share if rate else rate,
+                    burst=max(1, round(limit.get("burst", 1) * self.share)))
+            return self._buckets[host]
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """Process-wide limiter so every engine and worker shares one budget."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+        return _rate_limiter
@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from event.app_settings import app_settings
+
+DEFAULT_INTERVAL_HOURS = 48
+
+
+def next_crawl_interval(engine, history):
+    """
+    How long to wait before crawling a work item again, given its recent
+    `CrawlStat` rows (newest first).
+
+    Items that keep producing new events are crawled up to
+    CRAWL_ADAPTIVE_MAX_SPEEDUP times more often than the engine's base
+    interval. Each consecutive crawl without new events doubles the wait,
+    up to CRAWL_ADAPTIVE_MAX_BACKOFF times the base interval. Failed crawls
+    are retried at the shortest interval.
+    """
+    base = timedelta(hours=app_settings.CRAWL_ADAPTIVE_INTERVAL_HOURS.get(
+        engine, DEFAULT_INTERVAL_HOURS))
+    shortest = base / app_settings.CRAWL_ADAPTIVE_MAX_SPEEDUP
+    longest = base * app_settings.CRAWL_ADAPTIVE_MAX_BACKOFF
+    if not history:
+        return base
+    if history[0].failed:
+        return shortest
+
+    crawls = [stat for stat in history if not stat.failed]
+    idle = 0
+    for stat in crawls:
+        if stat.created:
+            break
+        idle += 1
+    if idle:
+        return min(longest, base * 2 ** idle)
+
+    average = sum(stat.created for stat in crawls) / len(crawls)
+    speedup = min(
+        app_settings.CRAWL_ADAPTIVE_MAX_SPEEDUP,
+        1 + average / app_settings.CRAWL_ADAPTIVE_CHURN_EVENTS)
+    return max(shortest, base / speedup)
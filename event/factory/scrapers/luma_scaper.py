@@ -72,6 +72,7 @@ class LumaEventScraper:
             "start_date": parse_datetime(data.get("startDate")),
             "end_date": parse_datetime(data.get("endDate")),
             "link": data.get("url", self.event_url),
+            "external_id": data.get("url", self.event_url),
             "organizers": [org.get("name") for org in data.get("organizer", [])],
         }
 
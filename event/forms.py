@@ -10,11 +10,10 @@ from django.utils.text import slugify
 from accounts.signals import (user_signed_up)
 from django.contrib.auth.models import User
 from .models import Event, RecentSearch
-from django.contrib.postgres.search import SearchQuery, SearchVector, SearchRank
 from django.db.models import Q, Case, When, Value, BooleanField
 from django.utils import timezone
-from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank
 from django import forms
+from event.search import search_events, cached_search
 from event.models import (Event, City, RecentSearch, BetaSubscriber)
 from django.db.models import (Case, When, Value, BooleanField, Q)
 
@@ -159,23 +158,14 @@ class BaseEventSearchForm(forms.Form):
 
     def get_event_recommendation(self):
         query = self.cleaned_data.get("q")
-        search_query = SearchQuery(query) if query else None
 
         # Base queryset: upcoming events
         events = Event.objects.filter(start_date__gte=timezone.now().date())
 
-        # Full-text search vector
-        if search_query:
-            search_vector = (
-                SearchVector('title', weight='A') +
-                SearchVector('venue', weight='B') +
-                SearchVector('city__city_ascii', weight='B') +
-                SearchVector('city__region__state_code', weight='C') +
-                SearchVector('city__area_code', weight='B')
-            )
-            events = events.annotate(
-                rank=SearchRank(search_vector, search_query)
-            ).filter(rank__gte=0.05).order_by('-rank', 'start_date')
+        # Full-text search over the stored, GIN-indexed search document
+        if query:
+            events = search_events(events, query, min_rank=0.05).order_by(
+                '-rank', 'start_date')
         else:
             events = events.order_by('start_date')
 
@@ -203,30 +193,41 @@ class BaseEventSearchForm(forms.Form):
 
 
 class EventSearchForm(BaseEventSearchForm):
-    def _filter_events_by_query(self, query: str):
-        search_query = SearchQuery(query)
-        search_vector = (
-            SearchVector('title', weight='A') +
-            SearchVector('city__region__short_name', weight='B') +
-            SearchVector('city__city_ascii', weight='B') +
-            SearchVector('city__region__state_code', weight='C') +
-            SearchVector('city__area_code__zip_code', weight='B')
+    MIN_RANK = 0.1
 
-        )
+    @property
+    def filter_event_queryset(self):
+        """`filter_event` as a live queryset, for callers that filter or order it in SQL."""
+        query = self.cleaned_data.get("q")
+        if not query:
+            return Event.objects.none()
+        self.create_search_history(query)
+        return self.search_queryset(query)
+
+    def _filter_events_by_query(self, query: str):
+        # Popular queries are served from the result cache and hydrated by
+        # primary key one page at a time.
+        today = timezone.now().date()
+        return cached_search(
+            self.search_queryset(query, today), query,
+            filters={"min_rank": self.MIN_RANK, "active_on": today})
+
+    def search_queryset(self, query: str, today=None):
+        # Zip codes are resolved to cities first, so this is a single-table
+        # query served by the GIN index: no join fan-out, no DISTINCT.
+        today = today or timezone.now().date()
         return (
-            Event.objects.annotate(
-                rank=SearchRank(search_vector, search_query),
+            search_events(Event.objects.all(), query, min_rank=self.MIN_RANK).annotate(
                 active=Case(
-                    When(start_date__gte=timezone.now().date(), then=Value(True)),
+                    When(start_date__gte=today, then=Value(True)),
                     default=Value(False),
                     output_field=BooleanField()
                 ),
                 event_timestamp=F('start_date')  # Optional: alias for clarity
             )
-            .filter(rank__gte=0.1, active=True)
+            .filter(active=True)
             # First by date, then by best match
             .order_by('event_timestamp', '-rank')
-            .distinct()
         )
 
         # return (
@@ -0,0 +1,84 @@
+import os
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from event.app_settings import app_settings
+from event.factory.extract import EXTRACTION_MODES
+from event.factory.benchmark import (
+    PAGE_KINDS, ScraperBenchmark, load_fixtures, load_response_cache)
+
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(__file__), "resources", "scraper_fixtures")
+
+
+class Command(BaseCommand):
+    help = "Replay recorded scraper pages offline and report parse throughput"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fixtures",
+            help="Corpus directory with one folder per page kind (default: bundled fixtures)",
+            dest="fixtures",
+            default=FIXTURES_DIR,
+        )
+        parser.add_argument(
+            "--from-cache",
+            help="Replay the pages stored in the crawl response cache (CRAWL_CACHE_DIR) instead",
+            action="store_true",
+            dest="from_cache",
+        )
+        parser.add_argument(
+            "-k", "--kind",
+            help=f"Only benchmark these page kinds ({', '.join(PAGE_KINDS)})",
+            action="append",
+            choices=PAGE_KINDS,
+            dest="kinds",
+        )
+        parser.add_argument(
+            "-r", "--repeat",
+            help="Replay the corpus this many times (default: 5)",
+            type=int,
+            dest="repeat",
+            default=5,
+        )
+        parser.add_argument(
+            "--extraction",
+            help="Embedded JSON extraction mode to benchmark (default: fast)",
+            choices=EXTRACTION_MODES,
+            dest="extraction",
+            default="fast",
+        )
+        parser.add_argument(
+            "--json",
+            help="Print the results as JSON",
+            action="store_true",
+            dest="json",
+        )
+
+    def handle(self, *args, **kwargs):
+        if kwargs.get("from_cache"):
+            corpus = load_response_cache(app_settings.CRAWL_CACHE_DIR)
+        else:
+            corpus = load_fixtures(kwargs["fixtures"])
+        if not corpus:
+            raise CommandError("No recorded pages found to benchmark")
+
+        benchmark = ScraperBenchmark(
+            corpus, repeat=kwargs["repeat"], extraction=kwargs["extraction"])
+        results = benchmark.run(kwargs.get("kinds"))
+        for kind, reason in benchmark.skipped.items():
+            self.stderr.write(f"Skipped {kind}: {reason}")
+        if kwargs.get("json"):
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        for result in results:
+            stages = ", ".join(
+                f"{stage} {seconds * 1000:.1f}ms" for stage, seconds in result["stages"].items())
+            self.stdout.write(
+                f"{result['kind']:<15} {result['pages']:>5} pages "
+                f"{result['bytes'] / 1024 / 1024:>7.2f} MB "
+                f"{result['pages_per_second']:>9.1f} pages/s "
+                f"{result['events_per_second']:>10.1f} events/s "
+                f"peak memory {result['peak_memory_mb']:.1f} MB  [{stages}]")
+        self.stdout.write(self.style.SUCCESS("Benchmark completed"))
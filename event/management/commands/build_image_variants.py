@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from event.models import Event
+from event.factory.images import store_image_variants
+
+
+class Command(BaseCommand):
+    help = "Generate responsive image variants for events that do not have them yet"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            help="Regenerate variants for every event with an image, replacing existing files",
+            action="store_true",
+            dest="all",
+        )
+
+    def handle(self, *args, **kwargs):
+        events = Event.objects.exclude(event_image="").exclude(event_image__isnull=True)
+        if not kwargs.get("all"):
+            events = events.filter(event_image_variants={})
+
+        built = failed = 0
+        # Events sharing a poster share its variants; build each file once.
+        for name in events.values_list("event_image", flat=True).distinct().iterator():
+            try:
+                variants = store_image_variants(name, rebuild=kwargs.get("all"))
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"Failed to build variants for {name}: {e}")
+                continue
+            Event.objects.filter(event_image=name).update(event_image_variants=variants)
+            built += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Built variants for {built} images ({failed} failed)"))
@@ -1,6 +1,26 @@
-from event.factory.engine import SearchEngine
-from django.core.management.base import BaseCommand
+import argparse
+from multiprocessing import get_context
+
+from django.db import connections
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
 from event.factory.engine import (SearchEngine)
+from event.factory.extract import EXTRACTION_MODES
+
+ENGINE_OPTIONS = ('engine', 'concurrency', 'per_host_concurrency', 'offline',
+                  'resume', 'resume_window', 'adaptive', 'extraction', 'max_pages',
+                  'archive')
+
+
+def shard_spec(value):
+    """Parse `N/M` into (N, M), with 1 <= N <= M."""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("Shard must look like N/M, e.g. 2/4")
+    if not 1 <= index <= total:
+        raise argparse.ArgumentTypeError("Shard N/M needs 1 <= N <= M")
+    return index, total
 
 
 class Command(BaseCommand):
@@ -9,17 +29,136 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument(
             '-e', "--engine",
-            help="Specify event search engine (`serp_api_google_event`, `eventbrite`, `all_events`, `artidea)",
+            help="Specify event search engine (`serp_api_google_event`, `eventbrite`, `all_events`, `artidea`, `ticketmaster`)",
             action="store",
             dest="engine",
             default='serp_api_google_event'  # Default value if not provided
         )
+        parser.add_argument(
+            '-c', "--concurrency",
+            help="Number of (phrase, city) work items processed in parallel (default: CRAWL_CONCURRENCY)",
+            type=int,
+            dest="concurrency",
+            default=None
+        )
+        parser.add_argument(
+            "--per-host",
+            help="Maximum in-flight requests per host (default: CRAWL_PER_HOST_CONCURRENCY)",
+            type=int,
+            dest="per_host_concurrency",
+            default=None
+        )
+        parser.add_argument(
+            "--offline",
+            help="Serve every request from the on-disk response cache and never hit the network",
+            action="store_true",
+            dest="offline",
+        )
+        parser.add_argument(
+            "--resume",
+            help="Skip work items completed within the resume window (see --resume-window)",
+            action="store_true",
+            dest="resume",
+        )
+        parser.add_argument(
+            "--resume-window",
+            help="Hours a completed work item is skipped for with --resume (default: CRAWL_RESUME_WINDOW_HOURS)",
+            type=float,
+            dest="resume_window",
+            default=None
+        )
+        parser.add_argument(
+            "--adaptive",
+            help="Only crawl work items the yield-based scheduler marks as due",
+            action="store_true",
+            dest="adaptive",
+        )
+        parser.add_argument(
+            "--extraction",
+            help="How embedded JSON is extracted from listing pages (default: CRAWL_EXTRACTION_MODES)",
+            choices=EXTRACTION_MODES,
+            dest="extraction",
+            default=None
+        )
+        parser.add_argument(
+            "--archive",
+            help="Append raw responses to the crawl archive for reparse_archive (default: CRAWL_ARCHIVE_ENABLED)",
+            action="store_true",
+            dest="archive",
+        )
+        parser.add_argument(
+            "--max-pages",
+            help="Listing pages walked per (city, phrase) by paginating engines (default: CRAWL_MAX_PAGES)",
+            type=int,
+            dest="max_pages",
+            default=None
+        )
+        parser.add_argument(
+            "--shard",
+            help="Only crawl the cities hashed to shard N of M (e.g. 2/4); host rate limits are divided by M",
+            type=shard_spec,
+            dest="shard",
+            default=None
+        )
+        parser.add_argument(
+            "--workers",
+            help="Fork N processes, each crawling one shard of the plan",
+            type=int,
+            dest="workers",
+            default=None
+        )
+
+    def run_workers(self, workers, kwargs):
+        options = {key: kwargs[key] for key in ENGINE_OPTIONS if key in kwargs}
+        # Children must not inherit the parent's open database connection.
+        connections.close_all()
+        context = get_context("fork")
+        processes = [
+            context.Process(
+                target=call_command, args=("fetch_events",),
+                kwargs={**options, "shard": (index, workers)},
+                name=f"fetch_events-{index}/{workers}")
+            for index in range(1, workers + 1)
+        ]
+        for process in processes:
+            process.start()
+        failed = []
+        for process in processes:
+            process.join()
+            if process.exitcode:
+                failed.append(process.name)
+        if failed:
+            raise CommandError(f"Crawl workers failed: {', '.join(failed)}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Event search completed successfully on {workers} workers"))
 
     def handle(self, *args, **kwargs):
         engine = kwargs.get('engine')
-        search = SearchEngine(engine=engine)
+        workers = kwargs.get('workers')
+        if workers and workers > 1:
+            if kwargs.get('shard'):
+                raise CommandError("Use either --shard or --workers, not both")
+            return self.run_workers(workers, kwargs)
+
+        search = SearchEngine(
+            engine=engine,
+            concurrency=kwargs.get('concurrency'),
+            per_host_concurrency=kwargs.get('per_host_concurrency'),
+            offline=kwargs.get('offline', False),
+            resume=kwargs.get('resume', False),
+            resume_window=kwargs.get('resume_window'),
+            adaptive=kwargs.get('adaptive', False),
+            shard=kwargs.get('shard'),
+            extraction=kwargs.get('extraction'),
+            max_pages=kwargs.get('max_pages'),
+            archive=kwargs.get('archive', False),
+        )
         if search.engine:
-            search.perform_search()
+            summary = search.perform_search()
+            label = f"Shard {summary['shard']}" if summary['shard'] else "Crawl"
+            self.stdout.write(
+                f"{label} (run {summary['run']}): {summary['completed']} completed, "
+                f"{summary['failed']} failed, {summary['skipped']} skipped")
             self.stdout.write(self.style.SUCCESS(
                 "Event search completed successfully"))
         else:
@@ -0,0 +1,89 @@
+import os
+import threading
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from event.app_settings import app_settings
+from event.factory.archive import archive_files, read_archive
+from event.factory.engine import SearchEngine
+from event.factory.executor import CrawlExecutor
+from event.factory.persistence import UpsertResult
+
+
+class Command(BaseCommand):
+    help = "Replay archived crawl responses through the current parsers and persist the events"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-e', "--engine",
+            help=f"Only replay responses archived by these engines ({', '.join(SearchEngine.ENGINES)})",
+            action="append",
+            choices=list(SearchEngine.ENGINES),
+            dest="engines",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only replay responses fetched on or after this date (YYYY-MM-DD)",
+            type=date.fromisoformat,
+            dest="since",
+            default=None
+        )
+        parser.add_argument(
+            "--archive-dir",
+            help="Archive directory (default: CRAWL_ARCHIVE_DIR)",
+            dest="archive_dir",
+            default=None
+        )
+        parser.add_argument(
+            '-w', "--workers",
+            help="Number of responses replayed in parallel (default: 4)",
+            type=int,
+            dest="workers",
+            default=4
+        )
+
+    def handle(self, *args, **kwargs):
+        # Archives are filed by event source
+        sources = {
+            SearchEngine.ENGINES[name].EVENT_SOURCE: SearchEngine.ENGINES[name]
+            for name in kwargs.get("engines") or SearchEngine.ENGINES
+        }
+        paths = archive_files(
+            kwargs["archive_dir"] or app_settings.CRAWL_ARCHIVE_DIR,
+            engines=set(sources), since=kwargs["since"])
+        if not paths:
+            raise CommandError("No archived responses found")
+        # Only engines with archived responses are built, so replaying one
+        # source does not need the API keys of the others.
+        engines = {
+            source: engine_class()
+            for source, engine_class in sources.items()
+            if any(os.path.basename(os.path.dirname(path)) == source for path in paths)
+        }
+
+        lock = threading.Lock()
+        totals = {"responses": 0, "replayed": 0, "created": 0, "updated": 0, "skipped": 0}
+
+        def replay(record):
+            result = engines[record["engine"]].replay_response(record["url"], record["body"])
+            with lock:
+                totals["responses"] += 1
+                if isinstance(result, UpsertResult):
+                    totals["replayed"] += 1
+                    totals["created"] += len(result.created)
+                    totals["updated"] += len(result.updated)
+                    totals["skipped"] += len(result.skipped)
+
+        executor = CrawlExecutor(kwargs["workers"], name="reparse")
+        try:
+            executor.run(read_archive(paths, since=kwargs["since"]), replay)
+        finally:
+            for engine in engines.values():
+                engine.geo.flush()
+                engine.images.close()
+
+        self.stdout.write(
+            f"Replayed {totals['replayed']} of {totals['responses']} responses from {len(paths)} files: "
+            f"{totals['created']} created, {totals['updated']} updated, {totals['skipped']} skipped, "
+            f"{executor.failed} failed")
+        self.stdout.write(self.style.SUCCESS("Archive replay completed"))
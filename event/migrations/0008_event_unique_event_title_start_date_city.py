@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Formerly deleted duplicate (title, start_date, city) events to make room
+    for a unique constraint on them. Event identity is (event_source,
+    external_id) since 0009, so duplicates across sources are kept and the
+    constraint is never created; this migration is kept as a no-op so the
+    history stays linear.
+    """
+
+    dependencies = [
+        ('event', '0007_alter_event_event_source'),
+    ]
+
+    operations = []
@@ -0,0 +1,68 @@
+import re
+
+from django.db import migrations, models
+
+EVENTBRITE_ID = re.compile(r"-(\d+)/?(?:\?|$)")
+LINK_SOURCES = ("all_events_in", "serp_api_google_event", "luma", "artidea")
+
+
+def backfill_external_ids(apps, schema_editor):
+    """
+    Derive source identifiers from stored links. Only the oldest row per
+    (source, identifier) is backfilled; later duplicates stay NULL.
+    """
+    Event = apps.get_model('event', 'Event')
+    seen = set()
+    pending = []
+    rows = (
+        Event.objects.filter(link__isnull=False)
+        .exclude(link="")
+        .order_by('id')
+        .only('id', 'event_source', 'link')
+    )
+    for event in rows.iterator(chunk_size=2000):
+        external_id = None
+        if event.event_source == "eventbrite":
+            match = EVENTBRITE_ID.search(event.link)
+            external_id = match.group(1) if match else None
+        elif event.event_source in LINK_SOURCES:
+            external_id = event.link[:255]
+        if not external_id or (event.event_source, external_id) in seen:
+            continue
+        seen.add((event.event_source, external_id))
+        event.external_id = external_id
+        pending.append(event)
+        if len(pending) >= 2000:
+            Event.objects.bulk_update(pending, ['external_id'])
+            pending = []
+    if pending:
+        Event.objects.bulk_update(pending, ['external_id'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0008_event_unique_event_title_start_date_city'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='external_id',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.RunPython(backfill_external_ids, migrations.RunPython.noop),
+        # Only databases that ran the original 0008 have this constraint
+        migrations.RunSQL(
+            "ALTER TABLE event_event DROP CONSTRAINT IF EXISTS unique_event_title_start_date_city",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['title', 'start_date', 'city'], name='event_natural_key_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='event',
+            constraint=models.UniqueConstraint(fields=('event_source', 'external_id'), name='unique_event_source_external_id'),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0009_event_external_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='event_image_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,35 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0011_crawlrun_crawlworkitem'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='crawlworkitem',
+            name='next_due_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='CrawlStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.PositiveIntegerField(default=0)),
+                ('unchanged', models.PositiveIntegerField(default=0)),
+                ('empty', models.BooleanField(default=False)),
+                ('failed', models.BooleanField(default=False)),
+                ('recorded_at', models.DateTimeField(auto_now_add=True)),
+                ('run', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='stats', to='event.crawlrun')),
+                ('work_item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='event.crawlworkitem')),
+            ],
+            options={
+                'verbose_name_plural': 'Crawl Stats',
+                'ordering': ['-recorded_at'],
+                'indexes': [models.Index(fields=['work_item', '-recorded_at'], name='crawl_stat_item_recent_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0012_crawlworkitem_next_due_at_crawlstat'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='crawlrun',
+            name='shard',
+            field=models.CharField(blank=True, default='', max_length=20),
+        ),
+    ]
@@ -0,0 +1,136 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0013_crawlrun_shard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='crawlrun',
+            name='http_requests',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='http_bytes',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='cache_hits',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='fetch_seconds',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='parse_seconds',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='persist_seconds',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='db_queries',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='db_seconds',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='events_created',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='events_updated',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='events_skipped',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='images_downloaded',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='errors',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='crawlstat',
+            name='updated',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlstat',
+            name='skipped',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlstat',
+            name='wall_seconds',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlstat',
+            name='fetch_seconds',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlstat',
+            name='parse_seconds',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlstat',
+            name='persist_seconds',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlstat',
+            name='http_requests',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlstat',
+            name='http_bytes',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlstat',
+            name='cache_hits',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlstat',
+            name='db_queries',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlstat',
+            name='db_seconds',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='crawlstat',
+            name='errors',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
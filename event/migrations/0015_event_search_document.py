@@ -0,0 +1,44 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+BACKFILL_SEARCH_DOCUMENT = """
+    UPDATE event_event AS target
+    SET search_document =
+        setweight(to_tsvector(coalesce(e.title, '')), 'A') ||
+        setweight(to_tsvector(coalesce(e.venue, '')), 'B') ||
+        setweight(to_tsvector(coalesce(c.city_ascii, '')), 'B') ||
+        setweight(to_tsvector(coalesce(l.short_name, '')), 'B') ||
+        setweight(to_tsvector(coalesce(l.state_code, '')), 'C') ||
+        setweight(to_tsvector(coalesce(z.zip_codes, '')), 'B')
+    FROM event_event AS e
+    LEFT JOIN event_city AS c ON c.id = e.city_id
+    LEFT JOIN event_location AS l ON l.id = c.region_id
+    LEFT JOIN (
+        SELECT link.city_id, string_agg(zip.zip_code, ' ') AS zip_codes
+        FROM event_city_area_code AS link
+        JOIN event_zipcode AS zip ON zip.id = link.zipcode_id
+        GROUP BY link.city_id
+    ) AS z ON z.city_id = c.id
+    WHERE target.id = e.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0014_crawl_instrumentation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='search_document',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(BACKFILL_SEARCH_DOCUMENT, reverse_sql=migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='event',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_document'], name='event_search_document_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations
+
+# Zip codes are resolved to cities at query time and no longer part of
+# the stored document.
+REBUILD_SEARCH_DOCUMENT = """
+    UPDATE event_event AS target
+    SET search_document =
+        setweight(to_tsvector(coalesce(e.title, '')), 'A') ||
+        setweight(to_tsvector(coalesce(e.venue, '')), 'B') ||
+        setweight(to_tsvector(coalesce(c.city_ascii, '')), 'B') ||
+        setweight(to_tsvector(coalesce(l.short_name, '')), 'B') ||
+        setweight(to_tsvector(coalesce(l.state_code, '')), 'C')
+    FROM event_event AS e
+    LEFT JOIN event_city AS c ON c.id = e.city_id
+    LEFT JOIN event_location AS l ON l.id = c.region_id
+    WHERE target.id = e.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0015_event_search_document'),
+    ]
+
+    operations = [
+        migrations.RunSQL(REBUILD_SEARCH_DOCUMENT, reverse_sql=migrations.RunSQL.noop),
+    ]
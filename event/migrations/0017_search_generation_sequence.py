@@ -0,0 +1,15 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0016_event_search_document_without_zip_codes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE SEQUENCE IF NOT EXISTS event_search_generation",
+            reverse_sql="DROP SEQUENCE IF EXISTS event_search_generation",
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0017_search_generation_sequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='crawlstat',
+            name='images_downloaded',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -6,6 +6,9 @@ from django.contrib.auth.models import User
 from django.utils.text import Truncator
 from django.utils import timezone
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django_cleanup import cleanup
 from task.utils.common_timezone import TIMEZONE_CHOICES
 
 
@@ -153,6 +156,9 @@ class SearchPhrase(models.Model):
         return self.query
 
 
+# Scraped images are stored once per source URL and shared between events,
+# so deleting or replacing one event's image must not remove the file.
+@cleanup.ignore
 class Event(models.Model):
     EVENT_SOURCE_CHOICES = (
         ("all_events_in", "All Events In"),
@@ -167,10 +173,22 @@ class Event(models.Model):
 
     class Meta:
         ordering = ['start_date', 'title',]
+        indexes = [
+            models.Index(fields=['title', 'start_date', 'city'],
+                         name='event_natural_key_idx'),
+            GinIndex(fields=['search_document'], name='event_search_document_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['event_source', 'external_id'],
+                name='unique_event_source_external_id'),
+        ]
 
     title = models.CharField(max_length=300)
     valid = models.BooleanField(default=False)
     event_image = models.FileField(upload_to='event', null=True, blank=True)
+    # Storage names of the resized WebP/JPEG copies of `event_image`
+    event_image_variants = models.JSONField(default=dict, blank=True)
     timestamp = models.DateTimeField(auto_now_add=True)
     start_date = models.DateField()
     end_date = models.DateField(blank=True, null=True)
@@ -180,6 +198,8 @@ class Event(models.Model):
     event_source = models.CharField(
         max_length=50, choices=EVENT_SOURCE_CHOICES, default="serp_api_google_event")
     link = models.URLField(blank=True, null=True)
+    # Identifier of the event at its source (Eventbrite ID, event URL, ...)
+    external_id = models.CharField(max_length=255, blank=True, null=True)
     city = models.ForeignKey(
         City, on_delete=models.SET_NULL, null=True, related_name="events")
     submitter_first_name = models.CharField(
@@ -192,6 +212,9 @@ class Event(models.Model):
         User, on_delete=models.CASCADE, blank=True, null=True)
     submitter_account_created = models.BooleanField(default=False)
     featured = models.BooleanField(default=False)
+    # Weighted tsvector of title, venue, city and state, kept current by
+    # `event.search.refresh_search_documents`
+    search_document = SearchVectorField(null=True, editable=False)
 
     @property
     def is_active(self):
@@ -206,6 +229,33 @@ class Event(models.Model):
             return self.event_image.url
         return '/static/home/assets/img/error/no-image-placeholder.jpg'
 
+    @property
+    def get_event_image_variants(self):
+        """
+        Responsive image URLs keyed by size label, plus ready-made `srcset`
+        strings per format. Empty until the variants have been generated.
+        """
+        sizes = (self.event_image_variants or {}).get("sizes", {})
+        if not sizes:
+            return {}
+        storage = self.event_image.storage
+        variants = {
+            label: {
+                "width": size["width"],
+                "webp": storage.url(size["webp"]),
+                "jpeg": storage.url(size["jpeg"]),
+            }
+            for label, size in sizes.items()
+        }
+        variants["srcset"] = {
+            image_format: ", ".join(
+                f"{variant[image_format]} {variant['width']}w"
+                for variant in sorted(variants.values(), key=lambda v: v["width"])
+            )
+            for image_format in ("webp", "jpeg")
+        }
+        return variants
+
 
 class RecentSearch(models.Model):
     class Meta:
@@ -250,3 +300,140 @@ class AppVersion(models.Model):
 
     def __str__(self):
         return self.version
+
+
+class CrawlRun(models.Model):
+    STATUS_CHOICES = (
+        ("running", "Running"),
+        ("completed", "Completed"),
+        ("failed", "Failed"),
+    )
+
+    class Meta:
+        ordering = ['-started_at']
+        verbose_name_plural = "Crawl Runs"
+
+    engine = models.CharField(max_length=50)
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default="running")
+    # host:pid:nonce of the process running the crawl; used as lease owner
+    owner = models.CharField(max_length=100)
+    resume = models.BooleanField(default=False)
+    # "N/M" when the run crawled one shard of the plan
+    shard = models.CharField(max_length=20, blank=True, default="")
+    items_completed = models.PositiveIntegerField(default=0)
+    items_failed = models.PositiveIntegerField(default=0)
+    items_skipped = models.PositiveIntegerField(default=0)
+    # Totals over the run's work items
+    http_requests = models.PositiveIntegerField(default=0)
+    http_bytes = models.PositiveBigIntegerField(default=0)
+    cache_hits = models.PositiveIntegerField(default=0)
+    fetch_seconds = models.FloatField(default=0)
+    parse_seconds = models.FloatField(default=0)
+    persist_seconds = models.FloatField(default=0)
+    db_queries = models.PositiveIntegerField(default=0)
+    db_seconds = models.FloatField(default=0)
+    events_created = models.PositiveIntegerField(default=0)
+    events_updated = models.PositiveIntegerField(default=0)
+    events_skipped = models.PositiveIntegerField(default=0)
+    images_downloaded = models.PositiveIntegerField(default=0)
+    # {"ConnectionError": 2, "HTTP 429": 5, ...}
+    errors = models.JSONField(default=dict, blank=True)
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return f"{self.engine} run {self.pk} ({self.status})"
+
+    @property
+    def wall_seconds(self):
+        if not self.finished_at:
+            return None
+        return (self.finished_at - self.started_at).total_seconds()
+
+    @property
+    def error_count(self):
+        return sum(self.errors.values()) if self.errors else 0
+
+
+class CrawlWorkItem(models.Model):
+    """Checkpoint of one (engine, phrase, city) unit of crawl work."""
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("completed", "Completed"),
+        ("failed", "Failed"),
+    )
+
+    class Meta:
+        ordering = ['engine', 'city', 'search_phrase']
+        verbose_name_plural = "Crawl Work Items"
+        indexes = [
+            models.Index(fields=['engine', 'status'],
+                         name='crawl_item_engine_status_idx'),
+        ]
+
+    # engine:phrase:city[:url hash], unique per unit of work
+    key = models.CharField(max_length=255, unique=True)
+    engine = models.CharField(max_length=50)
+    search_phrase = models.ForeignKey(
+        SearchPhrase, on_delete=models.CASCADE, null=True, blank=True,
+        related_name='crawl_items')
+    city = models.ForeignKey(
+        City, on_delete=models.CASCADE, related_name='crawl_items')
+    url = models.URLField(max_length=500, blank=True, null=True)
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default="pending")
+    run = models.ForeignKey(
+        CrawlRun, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='work_items')
+    lease_owner = models.CharField(max_length=100, blank=True, null=True)
+    leased_until = models.DateTimeField(blank=True, null=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, null=True)
+    last_started_at = models.DateTimeField(blank=True, null=True)
+    last_completed_at = models.DateTimeField(blank=True, null=True)
+    # When the adaptive scheduler wants this item crawled again
+    next_due_at = models.DateTimeField(blank=True, null=True, db_index=True)
+
+    def __str__(self):
+        return self.key
+
+
+class CrawlStat(models.Model):
+    """Yield of one crawl of a work item; drives adaptive scheduling."""
+    class Meta:
+        ordering = ['-recorded_at']
+        verbose_name_plural = "Crawl Stats"
+        indexes = [
+            models.Index(fields=['work_item', '-recorded_at'],
+                         name='crawl_stat_item_recent_idx'),
+        ]
+
+    work_item = models.ForeignKey(
+        CrawlWorkItem, on_delete=models.CASCADE, related_name='stats')
+    run = models.ForeignKey(
+        CrawlRun, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='stats')
+    created = models.PositiveIntegerField(default=0)
+    unchanged = models.PositiveIntegerField(default=0)
+    updated = models.PositiveIntegerField(default=0)
+    skipped = models.PositiveIntegerField(default=0)
+    # The source returned nothing usable for this item
+    empty = models.BooleanField(default=False)
+    failed = models.BooleanField(default=False)
+    wall_seconds = models.FloatField(default=0)
+    fetch_seconds = models.FloatField(default=0)
+    parse_seconds = models.FloatField(default=0)
+    persist_seconds = models.FloatField(default=0)
+    http_requests = models.PositiveIntegerField(default=0)
+    http_bytes = models.PositiveBigIntegerField(default=0)
+    cache_hits = models.PositiveIntegerField(default=0)
+    db_queries = models.PositiveIntegerField(default=0)
+    db_seconds = models.FloatField(default=0)
+    images_downloaded = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=dict, blank=True)
+    recorded_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.work_item} +{self.created}"
@@ -1,6 +1,13 @@
+import logging
 from event.signals import event_scraped
 from django.dispatch import receiver
+from django.db.models.signals import post_save, post_delete
+from event.models import Event, City, Location
+from event.search import refresh_search_documents, bump_search_generation
 from event.factory.scrapers.event_saver import EventSaver
+from event.factory.images import store_image_variants
+
+logger = logging.getLogger(__name__)
 
 
 @receiver(event_scraped)
@@ -8,3 +15,47 @@ def handle_luma_event_scraped(sender, event_data, source, **kwargs):
     if event_data.get('event_source') != 'luma':
         event = EventSaver(event_data)
         event.save()
+
+
+@receiver(post_save, sender=Event)
+def build_event_image_variants(sender, instance, **kwargs):
+    """Generate responsive variants for images uploaded through forms or the admin."""
+    variants = instance.event_image_variants or {}
+    if not instance.event_image:
+        if variants:
+            Event.objects.filter(pk=instance.pk).update(event_image_variants={})
+        return
+    if variants.get("source") == instance.event_image.name:
+        return
+    try:
+        variants = store_image_variants(instance.event_image.name)
+    except Exception as e:
+        logger.error(f"Failed to build image variants for event {instance.pk}: {e}")
+        return
+    Event.objects.filter(pk=instance.pk).update(event_image_variants=variants)
+    instance.event_image_variants = variants
+
+
+@receiver(post_save, sender=Event)
+def refresh_event_search_document(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_search_documents(event_ids=[instance.pk])
+
+
+@receiver(post_delete, sender=Event)
+def drop_cached_search_results(sender, instance, **kwargs):
+    # Saves refresh the search document, which bumps the generation itself
+    bump_search_generation()
+
+
+@receiver(post_save, sender=City)
+def refresh_city_search_documents(sender, instance, created=False, raw=False, **kwargs):
+    # A new city has no events yet
+    if not (created or raw):
+        refresh_search_documents(city_ids=[instance.pk])
+
+
+@receiver(post_save, sender=Location)
+def refresh_region_search_documents(sender, instance, created=False, raw=False, **kwargs):
+    if not (created or raw):
+        refresh_search_documents(region_ids=[instance.pk])
@@ -0,0 +1,210 @@
+import re
+import json
+import hashlib
+import logging
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import Cast
+from django.contrib.postgres.search import SearchQuery, SearchRank
+
+from event.app_settings import app_settings
+from event.models import Event, City, Location
+
+logger = logging.getLogger(__name__)
+
+# Weighted text of an event: the title first, then venue, city and state.
+# Zip codes are not part of it; a city has hundreds of them, so query
+# terms that are zip codes are resolved to cities instead, see
+# `search_events`.
+SEARCH_DOCUMENT = """
+    setweight(to_tsvector(coalesce(e.title, '')), 'A') ||
+    setweight(to_tsvector(coalesce(e.venue, '')), 'B') ||
+    setweight(to_tsvector(coalesce(c.city_ascii, '')), 'B') ||
+    setweight(to_tsvector(coalesce(l.short_name, '')), 'B') ||
+    setweight(to_tsvector(coalesce(l.state_code, '')), 'C')
+"""
+ZIP_CODE_TERM = re.compile(r"^\d{4,6}(?:-\d{4})?$")
+# Cached search results are filed under the current generation; bumping it
+# retires every cached result at once. It is a database sequence so crawl
+# processes invalidate the results cached by the web workers.
+SEARCH_GENERATION_SEQUENCE = "event_search_generation"
+SEARCH_RESULTS_PREFIX = "event-search-results"
+# Cached in place of the IDs of a result too large to cache
+TOO_MANY_RESULTS = "too-many"
+
+
+def _refresh_sql(where):
+    return f"""
+        UPDATE {Event._meta.db_table} AS target
+        SET search_document = {SEARCH_DOCUMENT}
+        FROM {Event._meta.db_table} AS e
+        LEFT JOIN {City._meta.db_table} AS c ON c.id = e.city_id
+        LEFT JOIN {Location._meta.db_table} AS l ON l.id = c.region_id
+        WHERE target.id = e.id AND {where}
+    """
+
+
+def refresh_search_documents(event_ids=None, city_ids=None, region_ids=None):
+    """
+    Recompute `Event.search_document` in one UPDATE for the given events,
+    the events of the given cities or of the given states, or for every
+    event when nothing is given. Returns the number of rows updated.
+    """
+    if event_ids is not None:
+        where, params = "e.id = ANY(%s)", [list(event_ids)]
+    elif city_ids is not None:
+        where, params = "e.city_id = ANY(%s)", [list(city_ids)]
+    elif region_ids is not None:
+        where, params = "c.region_id = ANY(%s)", [list(region_ids)]
+    else:
+        where, params = "TRUE", []
+    if params and not params[0]:
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(_refresh_sql(where), params)
+        updated = cursor.rowcount
+    if updated:
+        bump_search_generation()
+    return updated
+
+
+def resolve_zip_codes(query):
+    """
+    Split the zip codes out of a search query. Returns the IDs of the
+    cities they belong to, or None when the query holds no known zip
+    code, and the rest of the query.
+    """
+    terms = query.split()
+    candidates = {term for term in terms if ZIP_CODE_TERM.match(term)}
+    if not candidates:
+        return None, query
+    links = City.area_code.through.objects.filter(
+        zipcode__zip_code__in=candidates).values_list("zipcode__zip_code", "city_id")
+    city_ids, found = set(), set()
+    for zip_code, city_id in links:
+        found.add(zip_code)
+        city_ids.add(city_id)
+    if not found:
+        return None, query
+    return city_ids, " ".join(term for term in terms if term not in found)
+
+
+def search_events(events, query, min_rank):
+    """
+    Full-text filter `events` on their stored search document, annotated
+    with `rank`. Zip codes in `query` are looked up in their own index and
+    restrict the events to the matching cities, so the query stays on the
+    event table. A query made only of zip codes ranks every event in those
+    cities equally.
+    """
+    city_ids, text = resolve_zip_codes(query)
+    if city_ids is not None:
+        events = events.filter(city_id__in=city_ids)
+    if not text:
+        return events.annotate(rank=Value(1.0, output_field=FloatField()))
+    search_query = SearchQuery(text)
+    # ts_rank returns a real; as a double its value survives the round trip
+    # through a keyset cursor exactly.
+    return events.filter(search_document=search_query).annotate(
+        rank=Cast(SearchRank(F("search_document"), search_query), FloatField())
+    ).filter(rank__gte=min_rank)
+
+
+def search_generation():
+    with connection.cursor() as cursor:
+        # A new sequence reports last_value 1 before its first nextval(),
+        # which also returns 1; count that call.
+        cursor.execute(
+            f"SELECT last_value + is_called::int FROM {SEARCH_GENERATION_SEQUENCE}")
+        return cursor.fetchone()[0]
+
+
+def _next_generation():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT nextval(%s)", [SEARCH_GENERATION_SEQUENCE])
+
+
+def bump_search_generation():
+    """
+    Invalidate every cached search result. Called whenever events change,
+    once the change is committed, so no search can cache the old rows
+    under the new generation.
+    """
+    transaction.on_commit(_next_generation)
+
+
+def normalize_query(query):
+    return " ".join(query.lower().split())
+
+
+def search_results_key(query, filters):
+    digest = hashlib.sha256(json.dumps(
+        [normalize_query(query), filters], sort_keys=True, default=str).encode()).hexdigest()
+    return f"{SEARCH_RESULTS_PREFIX}:{search_generation()}:{digest}"
+
+
+class SearchResults:
+    """
+    The ranked event IDs of a search, hydrated by primary key one slice
+    (page) at a time. Supports what the paginators and list views need:
+    `count()`, `len()`, slicing, iteration and `select_related()`. Every
+    event carries its `rank`; events deleted since the IDs were cached
+    are left out of their page.
+    """
+
+    def __init__(self, hits, queryset=None):
+        self.hits = hits
+        self.queryset = Event.objects.all() if queryset is None else queryset
+
+    def select_related(self, *fields):
+        return SearchResults(self.hits, self.queryset.select_related(*fields))
+
+    def count(self):
+        return len(self.hits)
+
+    def __len__(self):
+        return len(self.hits)
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1 or None][0]
+        hits = self.hits[index]
+        events = self.queryset.in_bulk([event_id for event_id, _ in hits])
+        page = []
+        for event_id, rank in hits:
+            event = events.get(event_id)
+            if event is not None:
+                event.rank = rank
+                page.append(event)
+        return page
+
+
+def cached_search(queryset, query, filters):
+    """
+    Results of the search `queryset` for `query`, served from the result
+    cache when this query and `filters` (whatever else shaped `queryset`)
+    were searched in the current generation.
+
+    Results of up to SEARCH_RESULT_CACHE_MAX_IDS events are cached as their
+    ranked `(id, rank)` list for SEARCH_RESULT_CACHE_TTL seconds and come
+    back as `SearchResults`. Larger ones are not worth holding; `queryset`
+    itself is returned for them. The generation is read from the database
+    on every search, so writes made by any process retire the results
+    this one cached.
+    """
+    key = search_results_key(query, filters)
+    hits = cache.get(key)
+    if hits is None:
+        limit = app_settings.SEARCH_RESULT_CACHE_MAX_IDS
+        hits = [tuple(hit) for hit in queryset.values_list("id", "rank")[:limit + 1]]
+        if len(hits) > limit:
+            hits = TOO_MANY_RESULTS
+        cache.set(key, hits, app_settings.SEARCH_RESULT_CACHE_TTL)
+    if hits == TOO_MANY_RESULTS:
+        return queryset
+    return SearchResults(hits)
@@ -1,20 +1,12 @@
 from django.conf import settings
 from django.http import HttpRequest
 from django.contrib import messages
-from django.core.paginator import (Paginator, EmptyPage, PageNotAnInteger)
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from event.utils.pagination import paginate_queryset as _paginate_queryset
 
 
 def paginate_queryset(request, query_set: dict, per_page: int = 18,):
-    page = request.GET.get('page')
-    paginator = Paginator(query_set, per_page)
-    try:
-        paginated_queryset = paginator.page(page)
-    except PageNotAnInteger:
-        paginated_queryset = paginator.page(1)
-    except EmptyPage:
-        paginated_queryset = paginator.page(paginator.num_pages)
-    return paginated_queryset
+    # Totals are cached, and estimated for large results (event.utils.pagination)
+    return _paginate_queryset(request, query_set, per_page)
 
 
 def get_error_message_text(form_errors):
@@ -0,0 +1,96 @@
+import json
+import hashlib
+import logging
+
+from django.core.cache import cache
+from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.db import DatabaseError, connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+from event.app_settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+COUNT_CACHE_PREFIX = "pagination-count"
+
+
+def count_cache_key(queryset):
+    """
+    Cache key of a queryset's total: its SQL and parameters without the
+    ORDER BY, so every sort order of the same filters shares one count.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.sha256(f"{sql}|{params!r}".encode()).hexdigest()
+    return f"{COUNT_CACHE_PREFIX}:{queryset.db}:{digest}"
+
+
+def estimate_count(queryset):
+    """The planner's row estimate for `queryset`, or None where there is none."""
+    if connections[queryset.db].vendor != "postgresql":
+        return None
+    try:
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (DatabaseError, ValueError, LookupError, TypeError) as e:
+        logger.warning(f"Could not estimate the row count: {e}")
+        return None
+
+
+def count_queryset(queryset):
+    """
+    Total of `queryset` as `(count, approximate)`.
+
+    Totals the planner estimates at PAGINATION_ESTIMATE_THRESHOLD rows or
+    more are not counted, the estimate is returned and flagged approximate.
+    Smaller ones get an exact COUNT(*). Either way the total is cached for
+    PAGINATION_COUNT_CACHE_TTL seconds, so paging through the same results
+    does not count them again.
+    """
+    key = count_cache_key(queryset)
+    cached = cache.get(key)
+    if cached is not None:
+        return tuple(cached)
+    estimate = estimate_count(queryset)
+    if estimate is not None and estimate >= app_settings.PAGINATION_ESTIMATE_THRESHOLD:
+        total = (estimate, True)
+    else:
+        total = (queryset.count(), False)
+    cache.set(key, total, app_settings.PAGINATION_COUNT_CACHE_TTL)
+    return total
+
+
+class CountingPaginator(Paginator):
+    """
+    Paginator whose `count` comes from `count_queryset`. `approximate` is
+    True when the total is a planner estimate; pages past the estimated
+    last one are then served (possibly empty) instead of raising EmptyPage.
+    """
+    approximate = False
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+        total, self.approximate = count_queryset(self.object_list)
+        return total
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if self.approximate and int(number) > 1:
+                return int(number)
+            raise
+
+
+def paginate_queryset(request, query_set, per_page):
+    page = request.GET.get('page')
+    paginator = CountingPaginator(query_set, per_page)
+    try:
+        paginated_queryset = paginator.page(page)
+    except PageNotAnInteger:
+        paginated_queryset = paginator.page(1)
+    except EmptyPage:
+        paginated_queryset = paginator.page(paginator.num_pages)
+    return paginated_queryset
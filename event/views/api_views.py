@@ -4,7 +4,7 @@ from rest_framework.views import APIView
 import meilisearch
 from django.conf import settings
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from event.api.pagination import KeysetPagination, KeysetOrPageNumberMixin, CountingPageNumberPagination, uses_keyset
 from rest_framework import status
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
@@ -27,18 +27,31 @@ from rest_framework import serializers
 
 
 # Pagination
-class CustomPagination(PageNumberPagination):
+class CustomPagination(CountingPageNumberPagination):
     """Custom pagination class for API responses."""
     page_size = 24
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
+class EventKeysetPagination(KeysetPagination):
+    """Cursor pagination over upcoming events, for infinite scroll."""
+    ordering = ("start_date", "id")
+    page_size = 24
+    max_page_size = 100
+
+
+class SearchKeysetPagination(EventKeysetPagination):
+    # Same order as the page-number results: by date, then best match
+    ordering = ("start_date", "-rank", "id")
+
+
 # --- Active Events ---
 @extend_schema_view(
     get=extend_schema(
         summary="List Active Events",
-        description="Retrieve a paginated list of all active events (events with start date >= today)",
+        description="Retrieve a paginated list of all active events (events with start date >= today). "
+                    "Pass `cursor` (empty for the first page) for cursor pagination without a total count.",
         responses={
             200: EventSerializer(many=True),
             400: ErrorResponseSerializer,
@@ -46,10 +59,11 @@ class CustomPagination(PageNumberPagination):
         tags=["Events"]
     )
 )
-class ActiveEventListView(ListAPIView):
-    """List all active events with pagination."""
+class ActiveEventListView(KeysetOrPageNumberMixin, ListAPIView):
+    """List all active events, paginated by page number or by cursor (`?cursor=`)."""
     serializer_class = EventSerializer
     pagination_class = CustomPagination
+    keyset_pagination_class = EventKeysetPagination
 
     def get_queryset(self):
         return Event.objects.filter(
@@ -216,6 +230,13 @@ class BetaSubscriberAPIView(CreateAPIView):
                 required=False,
                 description='Page number for pagination'
             ),
+            OpenApiParameter(
+                name='cursor',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description='Cursor pagination: empty for the first page, then the `next` link of the previous page (no `count`)'
+            ),
             OpenApiParameter(
                 name='page_size',
                 type=OpenApiTypes.INT,
@@ -231,10 +252,11 @@ class BetaSubscriberAPIView(CreateAPIView):
         tags=['Search']
     )
 )
-class SearchResultAPIView(ListAPIView):
-    """Search events with query string and pagination."""
+class SearchResultAPIView(KeysetOrPageNumberMixin, ListAPIView):
+    """Search events with query string, paginated by page number or by cursor (`?cursor=`)."""
     serializer_class = EventSerializer
     pagination_class = CustomPagination
+    keyset_pagination_class = SearchKeysetPagination
     permission_classes = [AllowAny]
 
     def get_queryset(self):
@@ -245,6 +267,9 @@ class SearchResultAPIView(ListAPIView):
 
         form = EventSearchForm(self.request, {'q': query})
         if form.is_valid():
+            if uses_keyset(self.request):
+                # Cursor pages filter on (start_date, rank, id) in SQL
+                return form.filter_event_queryset.select_related('city__region__country')
             return form.filter_event.select_related('city__region__country')
         return Event.objects.none()
 
@@ -7,7 +7,7 @@ chmod 664 /home/web/app/logs/cron.log
 
 {
     echo "[$(date '+%Y-%m-%d %H:%M:%S')] Cron Job Output:"
-    /home/web/app/.venv/bin/python /home/web/app/manage.py fetch_events -e eventbrite
+    /home/web/app/.venv/bin/python /home/web/app/manage.py fetch_events -e eventbrite --resume --adaptive
     echo "[$(date '+%Y-%m-%d %H:%M:%S')] Finished fetching events from Eventbrite."
     echo "[$(date '+%Y-%m-%d %H:%M:%S')] Cron Job Completed."
 } >>/home/web/app/logs/cron.log 2>&1
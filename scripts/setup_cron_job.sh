@@ -4,11 +4,14 @@
 SCRIPTS_DIR="/home/web/app/scripts"
 
 # Define the cron jobs
+# The fetch scripts run with --adaptive, so a daily run only crawls the
+# cities whose yield history says they are due.
 CRON_JOBS=(
-    "0 12 */14 * * $SCRIPTS_DIR/fetch_events.sh"
-    "0 8 * * 1,3,5,7 $SCRIPTS_DIR/fetch_events_from_eventbrite.sh"
-    "0 8 * * 2,4,6 $SCRIPTS_DIR/fetch_events_from_all_events.sh"
+    "0 12 * * * $SCRIPTS_DIR/fetch_events.sh"
+    "0 8 * * * $SCRIPTS_DIR/fetch_events_from_eventbrite.sh"
+    "0 8 * * * $SCRIPTS_DIR/fetch_events_from_all_events.sh"
     "0 9 */7 * * $SCRIPTS_DIR/fetch_events_from_art_idea.sh"
+    "0 10 * * * $SCRIPTS_DIR/fetch_events_from_ticketmaster.sh"
     "0 0 * * * $SCRIPTS_DIR/sync_meili.sh"
 )
 
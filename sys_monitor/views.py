@@ -6,6 +6,10 @@ from django.http import JsonResponse
 from django.shortcuts import render
 import platform
 from django.views.generic import View
+from django.contrib.auth.mixins import LoginRequiredMixin
+
+from event.models import CrawlRun
+from event.app_settings import app_settings
 
 
 class SystemInfoView(View):
@@ -123,5 +127,34 @@ class SystemStatsView(View):
         })
 
 
+class CrawlMonitorView(LoginRequiredMixin, View):
+    """Recent crawl runs per engine, flagging runs whose yield dropped."""
+
+    def get(self, request, *args, **kwargs):
+        limit = app_settings.CRAWL_MONITOR_RUNS
+        engines = []
+        for engine in CrawlRun.objects.values_list("engine", flat=True).distinct().order_by("engine"):
+            runs = list(CrawlRun.objects.filter(engine=engine).order_by("-started_at")[:limit])
+            engines.append({
+                "engine": engine,
+                "runs": runs,
+                "yield_drop": self.get_yield_drop(runs),
+            })
+        return render(request, "sys_monitor/crawl_runs.html", {"engines": engines})
+
+    @staticmethod
+    def get_yield_drop(runs):
+        """The latest finished run, if it created far fewer events than the ones before it."""
+        finished = [run for run in runs if run.status == "completed"]
+        if len(finished) < 2:
+            return None
+        latest, previous = finished[0], finished[1:]
+        average = sum(run.events_created for run in previous) / len(previous)
+        if average and latest.events_created < average * app_settings.CRAWL_MONITOR_YIELD_DROP:
+            return {"run": latest, "average": average}
+        return None
+
+
 system_stats_view = SystemStatsView.as_view()
 system_info_view = SystemInfoView.as_view()
+crawl_monitor_view = CrawlMonitorView.as_view()
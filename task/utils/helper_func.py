@@ -1,7 +1,7 @@
-from django.core.paginator import (Paginator, EmptyPage, PageNotAnInteger)
 from django.contrib import messages
 from django.http import HttpRequest
 from django.conf import settings
+from event.utils.pagination import paginate_queryset as _paginate_queryset
 
 
 GUEST_COOKIE = getattr(settings, 'GUEST_COOKIE_NAME', '_guest_user_cookies')
@@ -31,12 +31,5 @@ def get_client_ip(request: HttpRequest):
 
 
 def paginate_queryset(request: HttpRequest, query_set: dict, per_page: int = 12,):
-    page = request.GET.get('page')
-    paginator = Paginator(query_set, per_page)
-    try:
-        paginated_queryset = paginator.page(page)
-    except PageNotAnInteger:
-        paginated_queryset = paginator.page(1)
-    except EmptyPage:
-        paginated_queryset = paginator.page(paginator.num_pages)
-    return paginated_queryset
+    # Totals are cached, and estimated for large results (event.utils.pagination)
+    return _paginate_queryset(request, query_set, per_page)
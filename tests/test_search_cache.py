@@ -0,0 +1,36 @@
+import pytest
+from django.db import connection
+
+from event.search import SEARCH_GENERATION_SEQUENCE, bump_search_generation, search_generation
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def new_sequence():
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER SEQUENCE {SEARCH_GENERATION_SEQUENCE} RESTART")
+
+
+def test_first_bump_on_a_new_sequence_changes_the_generation(new_sequence, django_capture_on_commit_callbacks):
+    before = search_generation()
+    with django_capture_on_commit_callbacks(execute=True):
+        bump_search_generation()
+    assert search_generation() != before
+
+
+def test_every_bump_changes_the_generation(django_capture_on_commit_callbacks):
+    generations = {search_generation()}
+    for _ in range(3):
+        with django_capture_on_commit_callbacks(execute=True):
+            bump_search_generation()
+        generations.add(search_generation())
+    assert len(generations) == 4
+
+
+def test_bump_waits_for_the_commit(django_capture_on_commit_callbacks):
+    before = search_generation()
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        bump_search_generation()
+    assert search_generation() == before
+    assert len(callbacks) == 1
@@ -0,0 +1,207 @@
+import json
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.contrib.gis.geos import Point
+
+from event.app_settings import app_settings
+from event.factory.engine import TicketmasterEngine
+from event.factory.executor import WorkItem
+from event.models import City, Country, Event, Location
+
+pytestmark = pytest.mark.django_db
+
+
+def make_event(index, venue=None):
+    event = {
+        "id": f"tm-{index}",
+        "name": f"Show {index}",
+        "url": f"https://www.ticketmaster.com/event/tm-{index}",
+        "info": f"Night {index}",
+        "dates": {"start": {"dateTime": "2030-05-01T20:00:00Z"}},
+    }
+    if venue is not None:
+        event["_embedded"] = {"venues": [venue]}
+    return event
+
+
+class DiscoveryStandIn(ThreadingHTTPServer):
+    """A local Discovery API serving `events` in pages, recording every request."""
+    daemon_threads = True
+
+    def __init__(self, events):
+        super().__init__(("127.0.0.1", 0), DiscoveryHandler)
+        self.events = events
+        self.requests = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}/discovery/v2/events.json"
+
+
+class DiscoveryHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        params = {name: values[0] for name, values in parse_qs(urlparse(self.path).query).items()}
+        self.server.requests.append(params)
+        page, size = int(params.get("page", 0)), int(params.get("size", 20))
+        events = self.server.events[page * size:(page + 1) * size]
+        body = {
+            "page": {
+                "size": size,
+                "number": page,
+                "totalElements": len(self.server.events),
+                "totalPages": math.ceil(len(self.server.events) / size),
+            },
+        }
+        if events:
+            body["_embedded"] = {"events": events}
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def discovery(monkeypatch):
+    servers = []
+
+    def serve(events, page_size=20):
+        server = DiscoveryStandIn(events)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        monkeypatch.setitem(app_settings.keys, "TICKET_MASTER_API_ENDPOINT", server.url)
+        monkeypatch.setitem(app_settings.keys, "TICKET_MASTER_API_KEY", "test-key")
+        monkeypatch.setitem(app_settings.keys, "TICKET_MASTER_PAGE_SIZE", page_size)
+        monkeypatch.setitem(app_settings.keys, "CRAWL_CACHE_ENABLED", False)
+        monkeypatch.setitem(app_settings.keys, "CRAWL_ARCHIVE_ENABLED", False)
+        return server
+
+    yield serve
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def engines():
+    built = []
+
+    def build(**kwargs):
+        engine = TicketmasterEngine(**kwargs)
+        built.append(engine)
+        return engine
+
+    yield build
+    for engine in built:
+        engine.images.close()
+        engine.geo.flush()
+
+
+def work_item(city, query="jazz"):
+    return WorkItem(search_phrase=None, location=city.region, city=city, url=None, query=query)
+
+
+@pytest.fixture
+def austin():
+    country = Country.objects.create(country_name="United States", iso2_code="US", iso3_code="USA")
+    region = Location.objects.create(
+        state_name="Texas", short_name="Texas", state_code="TX", timezone="America/Chicago",
+        lat="31.0", lng="-100.0", country=country)
+    return City.objects.create(
+        city_name="Austin", city_ascii="Austin", region=region, coords=Point(-97.7431, 30.2672),
+        lat="30.267200", lng="-97.743100", timezone="America/Chicago", active=True)
+
+
+class TestTicketmasterPaging:
+    def test_walks_every_page_of_a_search(self, discovery, engines, austin):
+        server = discovery([make_event(index) for index in range(45)], page_size=20)
+        engine = engines(max_pages=10)
+
+        events = engine.fetch_item(work_item(austin))
+
+        assert sorted(event["id"] for event in events) == sorted(f"tm-{index}" for index in range(45))
+        # Discovery pages are 0-based; the walk stops at `totalPages`
+        assert sorted(int(params["page"]) for params in server.requests) == [0, 1, 2]
+        params = server.requests[0]
+        assert params["apikey"] == "test-key"
+        assert params["keyword"] == "jazz"
+        assert params["size"] == "20"
+        assert params["radius"] == str(app_settings.TICKET_MASTER_RADIUS_MILES)
+        assert "geoPoint" in params and "stateCode" not in params
+
+    def test_honours_max_pages(self, discovery, engines, austin):
+        server = discovery([make_event(index) for index in range(100)], page_size=20)
+        engine = engines(max_pages=2)
+
+        events = engine.fetch_item(work_item(austin))
+
+        assert len(events) == 40
+        assert sorted(int(params["page"]) for params in server.requests) == [0, 1]
+
+    def test_stops_at_the_thousandth_event(self, discovery, engines, austin):
+        server = discovery([make_event(index) for index in range(3000)], page_size=200)
+        engine = engines(max_pages=10)
+
+        events = engine.fetch_item(work_item(austin))
+
+        # size * page may not pass 1000: pages 0-4 only
+        assert len(events) == 1000
+        assert sorted(int(params["page"]) for params in server.requests) == [0, 1, 2, 3, 4]
+
+    def test_searches_by_state_without_coordinates(self, discovery, engines, austin):
+        austin.lat = austin.lng = 0
+        server = discovery([make_event(0)])
+        engine = engines()
+
+        engine.fetch_item(work_item(austin))
+
+        assert server.requests[0]["stateCode"] == "TX"
+        assert server.requests[0]["countryCode"] == "US"
+        assert "geoPoint" not in server.requests[0]
+
+
+class TestTicketmasterPersistence:
+    def test_persists_events_in_their_venue_city(self, discovery, engines, austin):
+        venue = {
+            "name": "The Oasis",
+            "address": {"line1": "6550 Comanche Trail"},
+            "city": {"name": "Round Rock"},
+            "state": {"stateCode": "TX"},
+            "country": {"countryCode": "US"},
+            "postalCode": "78681",
+            "location": {"latitude": "30.5083", "longitude": "-97.6789"},
+        }
+        discovery([make_event(0, venue), make_event(1)])
+        engine = engines()
+        item = work_item(austin)
+
+        result = engine.persist_item(item, engine.parse_item(item, engine.fetch_item(item)))
+
+        assert len(result.created) == 2
+        in_venue = Event.objects.get(external_id="tm-0")
+        assert in_venue.event_source == "ticketmaster"
+        assert in_venue.city.city_name == "Round Rock"
+        assert in_venue.venue == "The Oasis, 6550 Comanche Trail, Round Rock, TX"
+        assert in_venue.link == "https://www.ticketmaster.com/event/tm-0"
+        # Without a venue address the event stays in the searched city
+        assert Event.objects.get(external_id="tm-1").city == austin
+
+    def test_recrawl_updates_instead_of_duplicating(self, discovery, engines, austin):
+        discovery([make_event(index) for index in range(3)])
+        engine = engines()
+        item = work_item(austin)
+
+        first = engine.persist_item(item, engine.parse_item(item, engine.fetch_item(item)))
+        second = engine.persist_item(item, engine.parse_item(item, engine.fetch_item(item)))
+
+        assert len(first.created) == 3
+        assert (len(second.created), len(second.updated)) == (0, 3)
+        assert Event.objects.filter(event_source="ticketmaster").count() == 3